@@ -11,11 +11,29 @@ from scraper import (
     run_twitter_dashboard,
 )
 from sentiment_facebook import SentimentAnalyzer
+from sentiment_insta import InstagramSentimentAnalyzer
+from sentiment_twitter import TwitterSentimentAnalyzer
 
 # Load environment variables
 load_dotenv()
 
 st.set_page_config(page_title="Unified Social Media Scraper", layout="wide")
+
+
+@st.cache_resource
+def get_sentiment_analyzer(platform):
+    """
+    One analyzer per platform for the app's lifetime, so cached text
+    results carry over between scrapes and reruns.
+    """
+    analyzers = {
+        "Facebook": SentimentAnalyzer,
+        "Instagram": InstagramSentimentAnalyzer,
+        "Twitter": TwitterSentimentAnalyzer,
+    }
+    return analyzers[platform]()
+
+
 st.title("🌐 Unified Social Media Scraper")
 
 # -----------------------
@@ -41,7 +59,17 @@ if platform == "Instagram":
     st.subheader("📊 Instagram Scraper")
 
     # Initialize scraper
-    scraper = InstagramScraperPipeline(API_TOKEN)
+    use_cache = st.checkbox(
+        "Reuse cached results (up to 6 hours old)",
+        value=True,
+        help="Untick to force fresh Apify runs.",
+    )
+    scraper = InstagramScraperPipeline(
+        API_TOKEN,
+        use_cache=use_cache,
+        sentiment_analyzer=get_sentiment_analyzer("Instagram"),
+    )
+    output_format = st.selectbox("Save results as:", ["csv", "parquet"])
     cookies_path = "cookies.txt"
 
     # Scraping Mode
@@ -91,12 +119,13 @@ if platform == "Instagram":
         st.dataframe(df.head(50))
 
         # 4️⃣ DOWNLOAD BUTTON
+        is_parquet = Path(output_file).suffix == ".parquet"
         with open(output_file, "rb") as f:
             st.download_button(
-                label="📂 Download CSV with Sentiment",
+                label=f"📂 Download {'Parquet' if is_parquet else 'CSV'} with Sentiment",
                 data=f,
                 file_name=Path(output_file).name,
-                mime="text/csv",
+                mime="application/octet-stream" if is_parquet else "text/csv",
             )
 
         # 5️⃣ DASHBOARD BUTTON
@@ -127,7 +156,9 @@ if platform == "Instagram":
                         max_comments=max_comments,
                         cookies_path=cookies_path,
                     )
-                    output_file = scraper.save_final_data(df, f"profile_{username}")
+                    output_file = scraper.save_final_data(
+                        df, f"profile_{username}", output_format
+                    )
                     scrape_and_visualize(df, output_file)
 
     # KEYWORD/HASHTAG SCRAPING
@@ -154,7 +185,9 @@ if platform == "Instagram":
                         max_comments=max_comments,
                         cookies_path=cookies_path,
                     )
-                    output_file = scraper.save_final_data(df, f"keyword_{keyword}")
+                    output_file = scraper.save_final_data(
+                        df, f"keyword_{keyword}", output_format
+                    )
                     scrape_and_visualize(df, output_file)
 
     # POST URL SCRAPING
@@ -178,7 +211,9 @@ if platform == "Instagram":
                         max_comments=max_comments,
                         cookies_path=cookies_path,
                     )
-                    output_file = scraper.save_final_data(df, "post_urls")
+                    output_file = scraper.save_final_data(
+                        df, "post_urls", output_format
+                    )
                     scrape_and_visualize(df, output_file)
 
 # ═══════════════════════════════════════════════════════════════════
@@ -188,7 +223,9 @@ elif platform == "Twitter":
     st.subheader("🐦 Twitter Scraper")
 
     # Initialize scraper
-    scraper = TwitterScraperPipeline(API_TOKEN)
+    scraper = TwitterScraperPipeline(
+        API_TOKEN, sentiment_analyzer=get_sentiment_analyzer("Twitter")
+    )
 
     # INPUTS
     user_input = st.text_input(
@@ -345,7 +382,9 @@ elif platform == "Facebook":
             st.warning("Please enter a valid URL or keyword.")
         else:
             st.info("Starting scraping... This may take a few minutes ⏳")
-            scraper = FacebookScraperPipeline(API_TOKEN)
+            scraper = FacebookScraperPipeline(
+                API_TOKEN, sentiment_analyzer=get_sentiment_analyzer("Facebook")
+            )
             try:
                 result = scraper.scrape_from_url(
                     page_url=target,
@@ -371,9 +410,9 @@ elif platform == "Facebook":
                         df_path = Path(result["final_file"])
                         df = pd.read_csv(df_path)
                         st.subheader("🧠 Sentiment Analysis")
-                        # Run sentiment
-                        analyzer = SentimentAnalyzer()
-                        df = analyzer.analyze_posts_and_comments(
+                        # Run sentiment (texts the pipeline already scored come
+                        # from the shared analyzer's cache)
+                        df = scraper.sentiment_analyzer.analyze_posts_and_comments(
                             df, post_col="post_message", comment_col="comment_text"
                         )
 
@@ -22,9 +22,12 @@ class InstagramDashboard:
             self.load_data(csv_file)
 
     def load_data(self, csv_file):
-        """Load data from CSV file and detect scraping mode"""
+        """Load data from a CSV or Parquet file and detect scraping mode"""
         try:
-            self.df = pd.read_csv(csv_file)
+            if Path(csv_file).suffix == ".parquet":
+                self.df = pd.read_parquet(csv_file)
+            else:
+                self.df = pd.read_csv(csv_file)
             self.csv_file = csv_file
 
             # Detect scraping mode
@@ -61,18 +64,18 @@ class InstagramDashboard:
             return "unknown"
 
     def find_latest_data(self):
-        """Find the latest CSV file in the final directory"""
+        """Find the latest CSV or Parquet file in the final directory"""
         final_dir = Path("Data/Instagram/final")
         if not final_dir.exists():
             print("❌ No data directory found!")
             return None
 
-        csv_files = list(final_dir.glob("*.csv"))
-        if not csv_files:
+        data_files = list(final_dir.glob("*.csv")) + list(final_dir.glob("*.parquet"))
+        if not data_files:
             print("❌ No data files found!")
             return None
 
-        latest_file = max(csv_files, key=os.path.getctime)
+        latest_file = max(data_files, key=os.path.getctime)
         print(f"📁 Found latest file: {latest_file.name}")
         return latest_file
 
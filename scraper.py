@@ -9,13 +9,27 @@ A unified scraper that allows users to choose between:
 Each scraper runs its original logic after selection.
 """
 
+import argparse
+import codecs
+import functools
+import hashlib
+import json
+import logging
+import operator
 import os
+import random
+import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 
 # Ensure the main imports work
 try:
     from apify_client import ApifyClient
+    import numpy as np
     import pandas as pd
     from dotenv import load_dotenv
 except ImportError as e:
@@ -23,10 +37,75 @@ except ImportError as e:
     print("Please install: pip install apify-client pandas python-dotenv")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+from sentiment_facebook import SentimentAnalyzer
+from sentiment_insta import InstagramSentimentAnalyzer
+from sentiment_twitter import TwitterSentimentAnalyzer
+from dashboard_facebook import run_dashboard
+from dashboard_insta import run_instagram_dashboard
+from dashboard_twitter import run_twitter_dashboard
+
 # Load environment variables once
 load_dotenv()
 
 
+def _json_loads(raw):
+    """Decode JSON bytes with orjson when installed, falling back to stdlib json."""
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _json_dumps(data, indent=False):
+    """Encode data as UTF-8 JSON bytes with orjson when installed, else stdlib json."""
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; stdlib json handles these
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode(
+        "utf-8"
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _apify_client(api_token):
+    """
+    Return the process-wide ApifyClient for api_token. The client owns a pooled
+    HTTP session, so sharing it lets every pipeline (and every Streamlit rerun)
+    reuse open keep-alive connections instead of paying a new TLS handshake.
+    """
+    return ApifyClient(api_token)
+
+
+def _write_csv(df, path):
+    """
+    Write df to path as UTF-8 CSV with a BOM (so Excel detects the encoding),
+    using pyarrow's C++ CSV writer when installed and pandas otherwise.
+    """
+    if pa is not None:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            with open(path, "wb") as f:
+                f.write(codecs.BOM_UTF8)
+                pa_csv.write_csv(table, f)
+            return
+        except (pa.ArrowException, TypeError, ValueError):
+            pass  # e.g. mixed-type object columns Arrow can't infer
+    df.to_csv(path, index=False, encoding="utf-8-sig")
+
+
 def print_banner():
     """Display welcome banner"""
     print("\n" + "=" * 70)
@@ -48,27 +127,37 @@ def get_main_choice():
     return choice
 
 
-from apify_client import ApifyClient
-import json
-from datetime import datetime
-import os
-import pandas as pd
-import re
-from pathlib import Path
-from dotenv import load_dotenv
+# ============================================================================
+# FACEBOOK SCRAPER
+# ============================================================================
 
-from sentiment_facebook import SentimentAnalyzer
-from dashboard_facebook import run_dashboard
+# Top-level keys of a group-scraper item, fetched in one C-level call
+_GROUP_KEYS = operator.itemgetter(
+    "postId",
+    "postUrl",
+    "postText",
+    "postTime",
+    "postAuthor",
+    "likes",
+    "comments",
+    "shares",
+    "image",
+    "video",
+)
 
-# Load environment variables
-load_dotenv()
+
+# Reaction labels; the emoji_* columns are derived from this order
+EMOJI_LABELS = ["like", "love", "haha", "wow", "sad", "angry", "care"]
 
 
 class FacebookScraperPipeline:
     """Complete Facebook scraping pipeline with multi-source support."""
 
-    def __init__(self, api_token):
-        self.client = ApifyClient(api_token)
+    def __init__(self, api_token, sentiment_analyzer=None):
+        self.client = _apify_client(api_token)
+        # One sentiment analyzer per pipeline, so its text cache carries over
+        # between saves; callers may pass in one shared across pipelines
+        self.sentiment_analyzer = sentiment_analyzer or SentimentAnalyzer()
 
         # Actor IDs
         self.posts_actor_id = "powerai/facebook-post-search-scraper"
@@ -148,8 +237,9 @@ class FacebookScraperPipeline:
 
         # Save data
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        raw_file = self._save_raw_data(complete_data, timestamp)
-        final_file = self._process_and_save_final(complete_data, timestamp)
+        rows = self._flatten_all(complete_data)
+        raw_file = self._save_raw_data(complete_data, rows, timestamp)
+        final_file = self._process_and_save_final(rows, timestamp)
 
         return {
             "raw_file": raw_file,
@@ -242,47 +332,40 @@ class FacebookScraperPipeline:
                 continue
 
             try:
-                for item in self.client.dataset(
-                    run["defaultDatasetId"]
-                ).iterate_items():
+                for item in self._fetch_dataset_items(run["defaultDatasetId"]):
                     if mode == "group":
+                        (
+                            post_id,
+                            post_url,
+                            message,
+                            post_time,
+                            author,
+                            likes,
+                            comments,
+                            shares,
+                            image,
+                            video,
+                        ) = self._group_item_fields(item)
                         all_posts.append(
                             {
-                                "post_id": item.get(
-                                    "postId",
-                                    item.get(
-                                        "post_id", item.get("url", "").split("/")[-1]
-                                    ),
-                                ),
-                                "url": item.get("postUrl", item.get("url", "")),
+                                "post_id": post_id,
+                                "url": post_url,
                                 "type": "post",
-                                "message": item.get(
-                                    "postText",
-                                    item.get("text", item.get("message", "")),
-                                ),
-                                "timestamp": item.get(
-                                    "postTime",
-                                    item.get("time", item.get("timestamp", "")),
-                                ),
-                                "author_id": item.get("postAuthor", {}).get("id", ""),
-                                "author_name": item.get("postAuthor", {}).get(
+                                "message": message,
+                                "timestamp": post_time,
+                                "author_id": author.get("id", ""),
+                                "author_name": author.get(
                                     "name", item.get("authorName", "")
                                 ),
-                                "author_url": item.get("postAuthor", {}).get(
+                                "author_url": author.get(
                                     "url", item.get("authorUrl", "")
                                 ),
-                                "author_profile_picture": item.get(
-                                    "postAuthor", {}
-                                ).get("profilePicture", ""),
-                                "total_reactions": item.get(
-                                    "likes", item.get("reactions", 0)
-                                ),
-                                "total_comments": item.get(
-                                    "comments", item.get("commentsCount", 0)
-                                ),
-                                "total_shares": item.get(
-                                    "shares", item.get("sharesCount", 0)
+                                "author_profile_picture": author.get(
+                                    "profilePicture", ""
                                 ),
+                                "total_reactions": likes,
+                                "total_comments": comments,
+                                "total_shares": shares,
                                 "emoji_like": 0,
                                 "emoji_love": 0,
                                 "emoji_haha": 0,
@@ -290,15 +373,8 @@ class FacebookScraperPipeline:
                                 "emoji_sad": 0,
                                 "emoji_angry": 0,
                                 "emoji_care": 0,
-                                "image_url": item.get(
-                                    "image",
-                                    (
-                                        item.get("images", [""])[0]
-                                        if item.get("images")
-                                        else ""
-                                    ),
-                                ),
-                                "video_url": item.get("video", ""),
+                                "image_url": image,
+                                "video_url": video,
                                 "video_thumbnail": "",
                                 "external_url": "",
                                 "comments": [],
@@ -349,6 +425,33 @@ class FacebookScraperPipeline:
         print(f"Successfully scraped {len(unique_posts)} posts")
         return list(unique_posts)
 
+    def _fetch_dataset_items(self, dataset_id):
+        """Download a whole dataset in one request and decode it in a single pass."""
+        raw = self.client.dataset(dataset_id).get_items_as_bytes(item_format="json")
+        return _json_loads(raw)
+
+    def _group_item_fields(self, item):
+        """Extract group post fields, falling back to alternate keys if any are missing."""
+        try:
+            return _GROUP_KEYS(item)
+        except KeyError:
+            return (
+                item.get(
+                    "postId", item.get("post_id", item.get("url", "").split("/")[-1])
+                ),
+                item.get("postUrl", item.get("url", "")),
+                item.get("postText", item.get("text", item.get("message", ""))),
+                item.get("postTime", item.get("time", item.get("timestamp", ""))),
+                item.get("postAuthor", {}),
+                item.get("likes", item.get("reactions", 0)),
+                item.get("comments", item.get("commentsCount", 0)),
+                item.get("shares", item.get("sharesCount", 0)),
+                item.get(
+                    "image", item.get("images", [""])[0] if item.get("images") else ""
+                ),
+                item.get("video", ""),
+            )
+
     def _scrape_comments(self, post_url, max_comments):
         if not post_url or str(post_url).strip() == "":
             return []
@@ -374,7 +477,7 @@ class FacebookScraperPipeline:
             return []
 
         try:
-            items = list(self.client.dataset(run["defaultDatasetId"]).iterate_items())
+            items = self._fetch_dataset_items(run["defaultDatasetId"])
         except Exception as e:
             print(f"Error iterating comments dataset: {e}")
             return []
@@ -402,47 +505,24 @@ class FacebookScraperPipeline:
     # Data Saving / Cleaning
     # ------------------------
 
-    def _save_raw_data(self, data, timestamp):
+    def _save_raw_data(self, data, rows, timestamp):
         json_file = self.preprocessing_dir / f"raw_data_{timestamp}.json"
-        with open(json_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(json_file, "wb") as f:
+            f.write(_json_dumps(data, indent=True))
 
         csv_file = self.preprocessing_dir / f"raw_data_{timestamp}.csv"
-        rows = []
-        for post in data:
-            if post.get("comments"):
-                for comment in post["comments"]:
-                    rows.append(
-                        {**self._flatten_post(post), **self._flatten_comment(comment)}
-                    )
-            else:
-                rows.append({**self._flatten_post(post), **self._empty_comment()})
-
         if rows:
             pd.DataFrame(rows).to_csv(csv_file, index=False, encoding="utf-8")
 
         return json_file
 
-    def _process_and_save_final(self, data, timestamp):
-        rows = []
-        for post in data:
-            if post.get("comments"):
-                for comment in post["comments"]:
-                    row = {**self._flatten_post(post), **self._flatten_comment(comment)}
-                    row = self._clean_row(row)
-                    rows.append(row)
-            else:
-                row = {**self._flatten_post(post), **self._empty_comment()}
-                row = self._clean_row(row)
-                rows.append(row)
-
+    def _process_and_save_final(self, rows, timestamp):
         if not rows:
             return None
 
         try:
-            df = pd.DataFrame(rows)
+            df = pd.DataFrame(self._dedupe_rows(rows))
             df = self._clean_dataframe(df)
-            df = df.drop_duplicates(subset=["post_id", "comment_id"], keep="first")
             df = self._add_derived_columns(df)
 
             # ========== SENTIMENT ANALYSIS TRIGGER ==========
@@ -451,8 +531,7 @@ class FacebookScraperPipeline:
             print("=" * 60)
 
             try:
-                sentiment_analyzer = SentimentAnalyzer()
-                df = sentiment_analyzer.analyze_posts_and_comments(df)
+                df = self.sentiment_analyzer.analyze_posts_and_comments(df)
                 print("✅ Sentiment analysis completed successfully!")
             except Exception as e:
                 print(f"⚠️  Sentiment analysis failed: {e}")
@@ -482,6 +561,18 @@ class FacebookScraperPipeline:
     # Flattening / Cleaning Helpers
     # ------------------------
 
+    def _flatten_all(self, data):
+        """Flatten posts and their comments into one row per comment (or per post)."""
+        rows = []
+        for post in data:
+            post_row = self._flatten_post(post)
+            if post.get("comments"):
+                for comment in post["comments"]:
+                    rows.append({**post_row, **self._flatten_comment(comment)})
+            else:
+                rows.append({**post_row, **self._empty_comment()})
+        return rows
+
     def _flatten_post(self, post):
         return {
             "post_id": post.get("post_id", ""),
@@ -531,11 +622,17 @@ class FacebookScraperPipeline:
             "comment_replies": 0,
         }
 
-    def _clean_row(self, row):
-        for field in ["post_message", "comment_text"]:
-            if field in row and row[field]:
-                row[field] = " ".join(str(row[field]).split()).replace("\x00", "")
-        return row
+    def _dedupe_rows(self, rows):
+        """Keep the first row per (post_id, comment_id) before building a DataFrame."""
+        seen = set()
+        unique_rows = []
+        for row in rows:
+            key = (row["post_id"], row["comment_id"])
+            if key in seen:
+                continue
+            seen.add(key)
+            unique_rows.append(row)
+        return unique_rows
 
     def _clean_dataframe(self, df):
         text_cols = [
@@ -557,15 +654,7 @@ class FacebookScraperPipeline:
         return df
 
     def _add_derived_columns(self, df):
-        emoji_cols = [
-            "emoji_like",
-            "emoji_love",
-            "emoji_haha",
-            "emoji_wow",
-            "emoji_sad",
-            "emoji_angry",
-            "emoji_care",
-        ]
+        emoji_cols = [f"emoji_{label}" for label in EMOJI_LABELS]
         for c in emoji_cols:
             if c not in df.columns:
                 df[c] = 0
@@ -585,7 +674,9 @@ class FacebookScraperPipeline:
             + df["post_total_comments"]
             + df["post_total_shares"]
         )
-        df["dominant_emotion"] = df[emoji_cols].idxmax(axis=1).str.replace("emoji_", "")
+        df["dominant_emotion"] = pd.Categorical.from_codes(
+            np.argmax(df[emoji_cols].to_numpy(), axis=1), categories=EMOJI_LABELS
+        )
         df["positive_reactions"] = (
             df["emoji_like"]
             + df["emoji_love"]
@@ -771,24 +862,209 @@ def run_facebook_scraper():
 # INSTAGRAM SCRAPER (from instagram_unified_scraper.py)
 # ============================================================================
 
-import os
-import json
-import logging
-from pathlib import Path
-from datetime import datetime
-import pandas as pd
-from dotenv import load_dotenv
-from apify_client import ApifyClient
+_SHORTCODE_RE = re.compile(r"instagram\.com/p/([^/?#]+)")
 
-from sentiment_insta import InstagramSentimentAnalyzer
-from dashboard_insta import run_instagram_dashboard
+# Fields of a comments-actor item and of its user/owner dict, fetched in one C-level call
+_COMMENT_KEYS = operator.itemgetter("text", "created_at", "comment_like_count")
+_USER_KEYS = operator.itemgetter("username", "full_name")
+
+
+def _tee_json_array(items, path: Path):
+    """Yield items while writing them to path as a JSON array, one item per line.
+
+    The array is written to a temporary file and only moved into place once the
+    iterator is exhausted with at least one item, so an interrupted or empty run
+    never leaves a partial file behind.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    count = 0
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(b"[")
+            for item in items:
+                f.write(b",\n" if count else b"\n")
+                f.write(_json_dumps(item))
+                count += 1
+                yield item
+            f.write(b"\n]\n")
+        if count:
+            os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def _first_present(*values):
+    """Return the first value that is not None (so 0 and "" count as present)."""
+    return next((v for v in values if v is not None), None)
+
+
+def _comment_fields(comment):
+    """Return (text, created_at, like_count) from a comments-actor item."""
+    try:
+        return _COMMENT_KEYS(comment)
+    except KeyError:
+        return (
+            comment.get("text"),
+            comment.get("created_at"),
+            comment.get("comment_like_count"),
+        )
+
+
+def _user_fields(user):
+    """Return (username, full_name) from a comment's user or owner dict."""
+    try:
+        return _USER_KEYS(user)
+    except KeyError:
+        return user.get("username"), user.get("full_name")
+
+
+def _shortcode(url):
+    """Return the post shortcode from an instagram.com/p/<shortcode>/ URL."""
+    match = _SHORTCODE_RE.search(url)
+    return match.group(1) if match else None
+
+
+@functools.lru_cache(maxsize=4096)
+def _canonical_post_url(raw):
+    """Normalise an instagram.com/p/... URL to https://www.instagram.com/p/<shortcode>/."""
+    shortcode = _shortcode(raw or "")
+    return f"https://www.instagram.com/p/{shortcode}/" if shortcode else None
+
+
+def _extend_records(columns, base_record, rows):
+    """
+    Append one record per row to a column store ({column: [values]}), as if
+    each record were {**base_record, **row}, padding columns missing from
+    either side with None so all lists stay aligned.
+
+    The merged dicts are never built: each base field is extended once with
+    len(rows) copies of its value, and only row fields are read per row.
+    """
+    row_keys = {}
+    for row in rows:
+        row_keys.update(dict.fromkeys(row))
+    row_columns = {}
+    for key in row_keys:
+        default = base_record.get(key)
+        row_columns[key] = [row[key] if key in row else default for row in rows]
+    _extend_columns(columns, base_record, row_columns, len(rows))
+
+
+def _extend_columns(columns, base_record, row_columns, n_new):
+    """
+    Column-wise form of _extend_records: append n_new records whose own
+    fields are given as {column: [n_new values]} and whose remaining fields
+    come from base_record.
+    """
+    n_rows = len(next(iter(columns.values()))) if columns else 0
+    for key in (*base_record, *row_columns):
+        if key not in columns:
+            columns[key] = [None] * n_rows
+    for key, values in columns.items():
+        if key in row_columns:
+            values.extend(row_columns[key])
+        else:
+            values.extend([base_record.get(key)] * n_new)
+
+
+# Comment fields emitted per row by scrape_post_urls, in column order
+_POST_URL_COMMENT_KEYS = (
+    "comment_id",
+    "comment_text",
+    "comment_username",
+    "comment_full_name",
+    "comment_likes",
+    "comment_date",
+    "comment_replies_count",
+)
+
+
+def _join_comment_text(comments_dict):
+    """
+    Return {post_url: "user: text || user: text ..."} for every post in
+    comments_dict with at least one non-empty comment, joined in one groupby.
+    """
+    comments_long = pd.DataFrame(
+        [
+            (post_url, c.get("comment_username"), c.get("comment_text"))
+            for post_url, comments in comments_dict.items()
+            for c in comments
+            if c.get("comment_text")
+        ],
+        columns=["post_url", "comment_username", "comment_text"],
+    )
+    if comments_long.empty:
+        return {}
+    lines = (
+        comments_long["comment_username"].fillna("None").astype(str)
+        + ": "
+        + comments_long["comment_text"].astype(str)
+    )
+    return (
+        lines.groupby(comments_long["post_url"], sort=False).agg(" || ".join).to_dict()
+    )
+
+
+logger = logging.getLogger(__name__)
+
+
+def _configure_instagram_logging():
+    """Attach the Instagram log file and console handlers once per process."""
+    if logger.handlers:
+        return
+    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
+    for handler in (
+        logging.FileHandler("instagram_scraper.log", mode="a", encoding="utf-8"),
+        logging.StreamHandler(sys.stdout),
+    ):
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+class _RateLimiter:
+    """Thread-safe token bucket allowing max_rate acquisitions per time_period seconds."""
+
+    def __init__(self, max_rate, time_period):
+        self.capacity = float(max_rate)
+        self.rate = max_rate / time_period
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until it becomes available if the bucket is empty."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            # Going negative reserves a future token for this caller
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+
+def _retry_delay(attempt, error):
+    """Exponential backoff with jitter before retrying a failed actor call."""
+    delay = 2**attempt + random.random()
+    if getattr(error, "status_code", None) == 429:
+        logger.warning("Rate limited by Apify, backing off %.1fs", delay)
+    return delay
 
 
 class InstagramScraperPipeline:
     """Complete Instagram scraping pipeline with multi-source support."""
 
-    def __init__(self, api_token):
-        self.client = ApifyClient(api_token)
+    def __init__(self, api_token, use_cache=True, sentiment_analyzer=None):
+        self.client = _apify_client(api_token)
+        # One sentiment analyzer per pipeline, so its text cache carries over
+        # between saves; callers may pass in one shared across pipelines
+        self.sentiment_analyzer = sentiment_analyzer or InstagramSentimentAnalyzer()
 
         # Actor IDs
         self.profile_actor_id = "apify/instagram-profile-scraper"
@@ -805,20 +1081,27 @@ class InstagramScraperPipeline:
         self.preprocessing_dir.mkdir(parents=True, exist_ok=True)
         self.final_dir.mkdir(parents=True, exist_ok=True)
 
+        # On-disk cache of actor results, keyed by actor ID + run input
+        self.use_cache = use_cache
+        self.cache_dir = Instagram_output_dir / ".apify_cache"
+        self.cache_ttl_seconds = 6 * 60 * 60
+        if self.use_cache:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Throttle actor calls so concurrent scrapes stay under Apify's rate limit
+        self._limiter = _RateLimiter(max_rate=30, time_period=60)
+
         # Timestamp for file naming
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
+        # Comments already fetched this session, per post URL
+        self._comments_by_url = {}
+
+        # Parsed cookies as (path, mtime, JSON string), reused until the file changes
+        self._cookies_cache = None
+
         # Setup logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s [%(levelname)s] %(message)s",
-            handlers=[
-                logging.FileHandler(
-                    "instagram_scraper.log", mode="a", encoding="utf-8"
-                ),
-                logging.StreamHandler(),
-            ],
-        )
+        _configure_instagram_logging()
 
         print("Instagram scraper initialized")
 
@@ -826,34 +1109,121 @@ class InstagramScraperPipeline:
     # Helper Methods
     # -------------------------
 
+    def _cache_path(self, actor_id: str, run_input: dict):
+        """Cache file for an actor run, keyed by a hash of actor ID and input."""
+        payload = json.dumps({"a": actor_id, "i": run_input}, sort_keys=True)
+        key = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    def _load_cached_items(self, cache_file: Path):
+        """Return cached items if the cache file exists and is still fresh."""
+        try:
+            if time.time() - cache_file.stat().st_mtime > self.cache_ttl_seconds:
+                return None
+            with open(cache_file, "rb") as f:
+                return _json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _store_cached_items(self, cache_file: Path, items: list):
+        """Write actor items to the cache; failures only cost a future re-run."""
+        try:
+            with open(cache_file, "wb") as f:
+                f.write(_json_dumps(items))
+        except (OSError, TypeError) as e:
+            logger.warning("Could not write actor cache %s: %s", cache_file, e)
+
     def _run_apify_actor(self, actor_id: str, run_input: dict):
-        """Run an Apify actor and return dataset items."""
+        """Run an Apify actor and return dataset items (served from cache if fresh)."""
+        cache_file = self._cache_path(actor_id, run_input) if self.use_cache else None
+        if cache_file:
+            cached = self._load_cached_items(cache_file)
+            if cached is not None:
+                logger.info("Using cached results for actor '%s'", actor_id)
+                return cached
+
         attempts = 3
         for attempt in range(1, attempts + 1):
             try:
-                logging.info(f"Running actor '{actor_id}', attempt {attempt}")
+                logger.info("Running actor '%s', attempt %d", actor_id, attempt)
+                self._limiter.acquire()
                 run = self.client.actor(actor_id).call(run_input=run_input)
                 dataset_id = run.get("defaultDatasetId")
                 if not dataset_id:
-                    logging.warning(f"No data returned from actor '{actor_id}'")
+                    logger.warning("No data returned from actor '%s'", actor_id)
                     return []
-                return list(self.client.dataset(dataset_id).iterate_items())
+                items = list(self.client.dataset(dataset_id).iterate_items())
+                if cache_file and items:
+                    self._store_cached_items(cache_file, items)
+                return items
             except Exception as e:
-                logging.error(f"Error on attempt {attempt} for actor '{actor_id}': {e}")
+                logger.error(
+                    "Error on attempt %d for actor '%s': %s", attempt, actor_id, e
+                )
                 if attempt == attempts:
                     return []
+                time.sleep(_retry_delay(attempt, e))
         return []
 
+    def _iter_apify_actor(self, actor_id: str, run_input: dict):
+        """Run an Apify actor and yield dataset items one at a time.
+
+        Unlike _run_apify_actor, the items are never held in a list: they are
+        streamed from the dataset (or the cache) and written to the cache as
+        they pass through. Only the actor call itself is retried.
+        """
+        cache_file = self._cache_path(actor_id, run_input) if self.use_cache else None
+        if cache_file:
+            cached = self._load_cached_items(cache_file)
+            if cached is not None:
+                logger.info("Using cached results for actor '%s'", actor_id)
+                yield from cached
+                return
+
+        dataset_id = None
+        attempts = 3
+        for attempt in range(1, attempts + 1):
+            try:
+                logger.info("Running actor '%s', attempt %d", actor_id, attempt)
+                self._limiter.acquire()
+                run = self.client.actor(actor_id).call(run_input=run_input)
+                dataset_id = run.get("defaultDatasetId")
+                break
+            except Exception as e:
+                logger.error(
+                    "Error on attempt %d for actor '%s': %s", attempt, actor_id, e
+                )
+                if attempt < attempts:
+                    time.sleep(_retry_delay(attempt, e))
+        if not dataset_id:
+            logger.warning("No data returned from actor '%s'", actor_id)
+            return
+
+        items = self.client.dataset(dataset_id).iterate_items()
+        if cache_file:
+            items = _tee_json_array(items, cache_file)
+        try:
+            yield from items
+        except Exception as e:
+            logger.error("Error reading dataset for actor '%s': %s", actor_id, e)
+
     def _save_preprocessed_data(self, items: list, name_prefix: str):
         """Save raw JSON of scraped data in preprocessing folder."""
         if not items:
             return None
         json_path = self.preprocessing_dir / f"{name_prefix}_{self.timestamp}.json"
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(items, f, indent=2, ensure_ascii=False)
-        logging.info(f"Raw JSON saved to: {json_path}")
+        with open(json_path, "wb") as f:
+            f.write(_json_dumps(items, indent=True))
+        logger.info("Raw JSON saved to: %s", json_path)
         return json_path
 
+    def _stream_preprocessed_data(self, items, name_prefix: str):
+        """Yield items while saving them as raw JSON in the preprocessing folder."""
+        json_path = self.preprocessing_dir / f"{name_prefix}_{self.timestamp}.json"
+        yield from _tee_json_array(items, json_path)
+        if json_path.exists():
+            logger.info("Raw JSON saved to: %s", json_path)
+
     def _parse_cookies_file(self, cookies_path: str):
         """Parse Netscape cookies.txt format."""
         cookies_list = []
@@ -877,9 +1247,135 @@ class InstagramScraperPipeline:
                             }
                         )
         except Exception as e:
-            logging.error(f"Error parsing cookies file: {e}")
+            logger.error("Error parsing cookies file: %s", e)
         return cookies_list
 
+    def _cookies_json(self, cookies_path: str):
+        """
+        Return the comments-actor cookie payload for cookies_path as a JSON
+        string ("[]" if no valid cookies). The file is only re-read and
+        re-serialised when its modification time changes.
+        """
+        mtime = os.path.getmtime(cookies_path)
+        cached = self._cookies_cache
+        if cached and cached[0] == cookies_path and cached[1] == mtime:
+            return cached[2]
+        cookies_list = self._parse_cookies_file(cookies_path)
+        cookies_json = _json_dumps(cookies_list).decode("utf-8")
+        self._cookies_cache = (cookies_path, mtime, cookies_json)
+        return cookies_json
+
+    def _fetch_comments(
+        self,
+        post_urls,
+        max_comments,
+        cookies_path="cookies.txt",
+        name_prefix="comments",
+        post_media_ids=None,
+    ):
+        """
+        Fetch comments for post_urls in a single comments actor run.
+        URLs already fetched this session with at least max_comments are reused.
+        Returns a dict of post URL -> list of comment records.
+        """
+        requested = list(dict.fromkeys(post_urls))
+        post_media_ids = post_media_ids or {}
+
+        to_fetch = [
+            url
+            for url in requested
+            if self._comments_by_url.get(url, (0, []))[0] < max_comments
+        ]
+        if len(to_fetch) < len(requested):
+            print(
+                f"♻️  Reusing comments already fetched for {len(requested) - len(to_fetch)} post(s)"
+            )
+
+        fetched = {}
+        if to_fetch:
+            if not Path(cookies_path).exists():
+                print(
+                    f"⚠️  Cookies file not found at {cookies_path}. Skipping comments."
+                )
+            else:
+                cookies_json = self._cookies_json(cookies_path)
+                if cookies_json == "[]":
+                    print("⚠️  No valid cookies found. Skipping comments.")
+                else:
+                    fetched = self._run_comments_actor(
+                        to_fetch,
+                        post_media_ids,
+                        max_comments,
+                        cookies_json,
+                        name_prefix,
+                    )
+
+        comments_dict = {}
+        for url in requested:
+            _, comments = self._comments_by_url.get(url, (0, []))
+            if comments:
+                comments_dict[url] = comments[:max_comments]
+        for url, comments in fetched.items():
+            if comments and url not in comments_dict:
+                comments_dict[url] = comments[:max_comments]
+
+        if fetched:
+            print(f"   Comments mapped to {len(comments_dict)} posts")
+        return comments_dict
+
+    def _run_comments_actor(
+        self, post_urls, post_media_ids, max_comments, cookies_json, name_prefix
+    ):
+        """Run the comments actor once for post_urls and group results by post URL."""
+        comment_run_input = {
+            "urls": post_urls,
+            "maxComments": max_comments,
+            "cookies": cookies_json,
+        }
+        # Comments are the largest actor output, so stream them straight into
+        # the per-post lists instead of holding the raw items as well.
+        comment_items = self._stream_preprocessed_data(
+            self._iter_apify_actor(self.comments_actor_id, comment_run_input),
+            name_prefix,
+        )
+
+        fetched = {url: [] for url in post_urls}
+        total = 0
+        for comment in comment_items:
+            total += 1
+            post_url = comment.get("postUrl")
+            media_id = str(comment.get("media_id", ""))
+
+            if post_url:
+                post_url = _canonical_post_url(post_url) or post_url
+
+            if not post_url and media_id and media_id in post_media_ids:
+                post_url = post_media_ids[media_id]
+
+            if not post_url:
+                continue
+
+            text, created_at, likes = _comment_fields(comment)
+            username, full_name = _user_fields(comment.get("user") or {})
+            fetched.setdefault(post_url, []).append(
+                {
+                    "comment_text": text,
+                    "comment_username": username,
+                    "comment_full_name": full_name,
+                    "comment_likes": likes,
+                    "comment_date": created_at or comment.get("created_at_utc"),
+                }
+            )
+
+        if not total:
+            return {}
+
+        for url, comments in fetched.items():
+            self._comments_by_url[url] = (max_comments, comments)
+
+        print(f"✅ Scraped {total} total comments")
+        return fetched
+
     def _apply_sentiment_analysis(self, df):
         """Apply sentiment analysis to dataframe"""
         if df.empty:
@@ -890,8 +1386,7 @@ class InstagramScraperPipeline:
             print("🤖 APPLYING SENTIMENT ANALYSIS...")
             print("=" * 70)
 
-            analyzer = InstagramSentimentAnalyzer()
-            df = analyzer.analyze_instagram_data(df)
+            df = self.sentiment_analyzer.analyze_instagram_data(df)
 
             print("✅ Sentiment analysis completed!")
             print("=" * 70 + "\n")
@@ -918,46 +1413,58 @@ class InstagramScraperPipeline:
         print(f"🔍 COMPREHENSIVE PROFILE SCRAPE: @{username}")
         print(f"{'='*70}")
 
-        # Step 1: Get profile info
+        # Steps 1 & 2: profile info and posts are independent, so run both actors
+        # concurrently; only the comments step has to wait for the post URLs.
         print(f"\n📊 Step 1/3: Fetching profile information...")
+        print(f"📸 Step 2/3: Fetching {max_posts} recent posts...")
         profile_run_input = {"usernames": [username], "resultsLimit": 1}
-        profile_items = self._run_apify_actor(self.profile_actor_id, profile_run_input)
+        posts_run_input = {"username": [username], "resultsLimit": max_posts}
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            profile_future = executor.submit(
+                self._run_apify_actor, self.profile_actor_id, profile_run_input
+            )
+            posts_future = executor.submit(
+                self._run_apify_actor, self.post_actor_id, posts_run_input
+            )
+            profile_items = profile_future.result()
+            post_items = posts_future.result()
         self._save_preprocessed_data(profile_items, f"profile_{username}")
+        self._save_preprocessed_data(post_items, f"posts_{username}")
 
         profile_data = {}
-        if profile_items:
-            for item in profile_items:
-                if (
-                    item.get("followersCount") is not None
-                    or item.get("followers") is not None
-                ):
-                    profile_data = {
-                        "profile_username": item.get("username"),
-                        "profile_full_name": item.get("fullName")
-                        or item.get("full_name"),
-                        "profile_bio": item.get("biography") or item.get("bio"),
-                        "profile_followers": item.get("followersCount")
-                        or item.get("followers"),
-                        "profile_following": item.get("followsCount")
-                        or item.get("following"),
-                        "profile_total_posts": item.get("postsCount")
-                        or item.get("posts"),
-                    }
-                    print(
-                        f"✅ Profile: {profile_data['profile_followers']} followers, {profile_data['profile_total_posts']} posts"
-                    )
-                    break
+        item = next(
+            (
+                it
+                for it in profile_items or ()
+                if it.get("followersCount") is not None
+                or it.get("followers") is not None
+            ),
+            None,
+        )
+        if item:
+            # Counts use _first_present so a genuine 0 isn't mistaken for missing
+            profile_data = {
+                "profile_username": item.get("username"),
+                "profile_full_name": item.get("fullName") or item.get("full_name"),
+                "profile_bio": item.get("biography") or item.get("bio"),
+                "profile_followers": _first_present(
+                    item.get("followersCount"), item.get("followers")
+                ),
+                "profile_following": _first_present(
+                    item.get("followsCount"), item.get("following")
+                ),
+                "profile_total_posts": _first_present(
+                    item.get("postsCount"), item.get("posts")
+                ),
+            }
+            print(
+                f"✅ Profile: {profile_data['profile_followers']} followers, {profile_data['profile_total_posts']} posts"
+            )
 
         if not profile_data:
             print("❌ Could not retrieve profile information")
             return pd.DataFrame()
 
-        # Step 2: Get posts
-        print(f"\n📸 Step 2/3: Fetching {max_posts} recent posts...")
-        posts_run_input = {"username": [username], "resultsLimit": max_posts}
-        post_items = self._run_apify_actor(self.post_actor_id, posts_run_input)
-        self._save_preprocessed_data(post_items, f"posts_{username}")
-
         if not post_items:
             print("⚠️  No posts found")
             return pd.DataFrame()
@@ -976,18 +1483,25 @@ class InstagramScraperPipeline:
                 post_url = f"https://www.instagram.com/p/{shortcode}/"
             elif post_url and "instagram.com" not in post_url:
                 post_url = f"https://www.instagram.com/p/{post_url}/"
+            elif post_url:
+                post_url = _canonical_post_url(post_url) or post_url
 
             if post_url:
                 post_urls.append(post_url)
-                posts_dict[post_url] = {
+                # Posts are keyed by shortcode so the comment join needs no URL parsing
+                posts_dict[_shortcode(post_url) or post_url] = {
                     "post_url": post_url,
                     "post_caption": item.get("caption") or item.get("text"),
-                    "post_likes": item.get("likesCount")
-                    or item.get("like_count")
-                    or item.get("likes"),
-                    "post_comments_count": item.get("commentsCount")
-                    or item.get("comment_count")
-                    or item.get("comments"),
+                    "post_likes": _first_present(
+                        item.get("likesCount"),
+                        item.get("like_count"),
+                        item.get("likes"),
+                    ),
+                    "post_comments_count": _first_present(
+                        item.get("commentsCount"),
+                        item.get("comment_count"),
+                        item.get("comments"),
+                    ),
                     "post_date": item.get("timestamp")
                     or item.get("post_date")
                     or item.get("created_at"),
@@ -1002,77 +1516,22 @@ class InstagramScraperPipeline:
         comments_dict = {}
         if include_comments and post_urls:
             print(f"\n💬 Step 3/3: Fetching up to {max_comments} comments per post...")
-
-            if not Path(cookies_path).exists():
-                print(
-                    f"⚠️  Cookies file not found at {cookies_path}. Skipping comments."
-                )
-            else:
-                cookies_list = self._parse_cookies_file(cookies_path)
-                if not cookies_list:
-                    print("⚠️  No valid cookies found. Skipping comments.")
-                else:
-                    cookies_json_string = json.dumps(cookies_list)
-                    comment_run_input = {
-                        "urls": post_urls,
-                        "maxComments": max_comments,
-                        "cookies": cookies_json_string,
-                    }
-
-                    comment_items = self._run_apify_actor(
-                        self.comments_actor_id, comment_run_input
-                    )
-                    self._save_preprocessed_data(comment_items, f"comments_{username}")
-
-                    if comment_items:
-                        for comment in comment_items:
-                            post_url = comment.get("postUrl")
-                            media_id = str(comment.get("media_id", ""))
-
-                            if post_url:
-                                if "instagram.com/p/" in post_url:
-                                    parts = post_url.split("/p/")
-                                    if len(parts) > 1:
-                                        shortcode = (
-                                            parts[1]
-                                            .strip("/")
-                                            .split("/")[0]
-                                            .split("?")[0]
-                                        )
-                                        post_url = (
-                                            f"https://www.instagram.com/p/{shortcode}/"
-                                        )
-
-                            if not post_url and media_id and media_id in post_media_ids:
-                                post_url = post_media_ids[media_id]
-
-                            if not post_url:
-                                continue
-
-                            if post_url not in comments_dict:
-                                comments_dict[post_url] = []
-
-                            user = comment.get("user", {})
-                            comments_dict[post_url].append(
-                                {
-                                    "comment_text": comment.get("text"),
-                                    "comment_username": user.get("username"),
-                                    "comment_full_name": user.get("full_name"),
-                                    "comment_likes": comment.get("comment_like_count")
-                                    or comment.get("comment_like_count"),
-                                    "comment_date": comment.get("created_at")
-                                    or comment.get("created_at_utc"),
-                                }
-                            )
-
-                        print(f"✅ Scraped {len(comment_items)} total comments")
-                        print(f"   Comments mapped to {len(comments_dict)} posts")
+            comments_dict = self._fetch_comments(
+                post_urls,
+                max_comments,
+                cookies_path,
+                f"comments_{username}",
+                post_media_ids,
+            )
 
         # Combine all data into unified records
         print(f"\n🔄 Combining all data...")
-        unified_records = []
+        columns = {}
+        comments_by_key = {
+            _shortcode(url) or url: comments for url, comments in comments_dict.items()
+        }
 
-        for post_url, post_data in posts_dict.items():
+        for post_key, post_data in posts_dict.items():
             base_record = {
                 **profile_data,
                 **post_data,
@@ -1080,40 +1539,27 @@ class InstagramScraperPipeline:
                 "source_value": username,
             }
 
-            post_comments = comments_dict.get(post_url, [])
-
-            if not post_comments and "instagram.com/p/" in post_url:
-                shortcode = (
-                    post_url.split("/p/")[1].strip("/").split("/")[0].split("?")[0]
-                )
-                for comment_url in comments_dict.keys():
-                    if shortcode in comment_url:
-                        post_comments = comments_dict[comment_url]
-                        break
-
-            if post_comments:
-                for comment in post_comments:
-                    record = {**base_record, **comment}
-                    unified_records.append(record)
-            else:
-                record = {
-                    **base_record,
-                    "comment_text": None,
-                    "comment_username": None,
-                    "comment_full_name": None,
-                    "comment_likes": None,
-                    "comment_date": None,
-                }
-                unified_records.append(record)
+            post_comments = comments_by_key.get(post_key)
+            if not post_comments:
+                post_comments = [
+                    {
+                        "comment_text": None,
+                        "comment_username": None,
+                        "comment_full_name": None,
+                        "comment_likes": None,
+                        "comment_date": None,
+                    }
+                ]
+            _extend_records(columns, base_record, post_comments)
 
-        df = pd.DataFrame(unified_records)
+        df = pd.DataFrame(columns)
 
         print(f"\n{'='*70}")
         print(f"✅ SCRAPING COMPLETE!")
         print(f"   • Profile: {profile_data['profile_username']}")
         print(f"   • Posts: {len(posts_dict)}")
         print(f"   • Comments: {sum(len(c) for c in comments_dict.values())}")
-        print(f"   • Total rows: {len(unified_records)}")
+        print(f"   • Total rows: {len(df)}")
         print(f"{'='*70}")
 
         return df
@@ -1157,6 +1603,8 @@ class InstagramScraperPipeline:
                 post_url = f"https://www.instagram.com/p/{shortcode}/"
             elif post_url and "instagram.com" not in post_url:
                 post_url = f"https://www.instagram.com/p/{post_url}/"
+            elif post_url:
+                post_url = _canonical_post_url(post_url) or post_url
 
             if post_url:
                 post_urls.append(post_url)
@@ -1164,12 +1612,16 @@ class InstagramScraperPipeline:
                     "post_url": post_url,
                     "post_username": item.get("ownerUsername") or item.get("username"),
                     "post_caption": item.get("caption") or item.get("text"),
-                    "post_likes": item.get("likesCount")
-                    or item.get("like_count")
-                    or item.get("likes"),
-                    "post_comments_count": item.get("commentsCount")
-                    or item.get("comment_count")
-                    or item.get("comments"),
+                    "post_likes": _first_present(
+                        item.get("likesCount"),
+                        item.get("like_count"),
+                        item.get("likes"),
+                    ),
+                    "post_comments_count": _first_present(
+                        item.get("commentsCount"),
+                        item.get("comment_count"),
+                        item.get("comments"),
+                    ),
                     "post_date": item.get("timestamp")
                     or item.get("post_date")
                     or item.get("created_at"),
@@ -1180,46 +1632,13 @@ class InstagramScraperPipeline:
         comments_dict = {}
         if include_comments and post_urls:
             print(f"\n💬 Step 2/2: Fetching up to {max_comments} comments per post...")
-
-            if not Path(cookies_path).exists():
-                print(f"⚠️  Cookies file not found. Skipping comments.")
-            else:
-                cookies_list = self._parse_cookies_file(cookies_path)
-                if cookies_list:
-                    cookies_json_string = json.dumps(cookies_list)
-                    comment_run_input = {
-                        "urls": post_urls,
-                        "maxComments": max_comments,
-                        "cookies": cookies_json_string,
-                    }
-
-                    comment_items = self._run_apify_actor(
-                        self.comments_actor_id, comment_run_input
-                    )
-                    self._save_preprocessed_data(
-                        comment_items, f"comments_keyword_{keyword}"
-                    )
-
-                    if comment_items:
-                        for comment in comment_items:
-                            post_url = comment.get("postUrl")
-                            if post_url not in comments_dict:
-                                comments_dict[post_url] = []
-
-                            user = comment.get("user", {})
-                            comments_dict[post_url].append(
-                                {
-                                    "comment_text": comment.get("text"),
-                                    "comment_username": user.get("username"),
-                                    "comment_full_name": user.get("full_name"),
-                                    "comment_likes": comment.get("comment_like_count"),
-                                    "comment_date": comment.get("created_at"),
-                                }
-                            )
-                        print(f"✅ Scraped {len(comment_items)} total comments")
+            comments_dict = self._fetch_comments(
+                post_urls, max_comments, cookies_path, f"comments_keyword_{keyword}"
+            )
 
         print(f"\n🔄 Combining all data...")
-        unified_records = []
+        columns = {}
+        all_comments_text_by_url = _join_comment_text(comments_dict)
 
         for post_url, post_data in posts_dict.items():
             base_record = {
@@ -1232,32 +1651,29 @@ class InstagramScraperPipeline:
             comments_scraped_count = len(post_comments)
 
             if comments_scraped_count > 0:
-                all_comments_text = " || ".join(
-                    [
-                        f"{c.get('comment_username')}: {c.get('comment_text')}"
-                        for c in post_comments
-                        if c.get("comment_text")
-                    ]
-                )
+                all_comments_text = all_comments_text_by_url.get(post_url, "")
             else:
                 all_comments_text = None
 
-            record = {
-                **base_record,
-                "comments_scraped_count": comments_scraped_count,
-                "all_comments_text": all_comments_text,
-            }
-
-            unified_records.append(record)
+            _extend_records(
+                columns,
+                base_record,
+                [
+                    {
+                        "comments_scraped_count": comments_scraped_count,
+                        "all_comments_text": all_comments_text,
+                    }
+                ],
+            )
 
-        df = pd.DataFrame(unified_records)
+        df = pd.DataFrame(columns)
 
         print(f"\n{'='*70}")
         print(f"✅ SCRAPING COMPLETE!")
         print(f"   • Keyword: #{keyword}")
         print(f"   • Posts: {len(posts_dict)}")
         print(f"   • Comments scraped: {sum(len(c) for c in comments_dict.values())}")
-        print(f"   • Total rows: {len(unified_records)}")
+        print(f"   • Total rows: {len(df)}")
         print(f"{'='*70}")
 
         return df
@@ -1292,7 +1708,8 @@ class InstagramScraperPipeline:
 
         print(f"✅ Retrieved {len(post_items)} post(s)")
         print(f"\n🔄 Processing posts and comments...")
-        unified_records = []
+        columns = {}
+        seen = set()  # (post_url, comment_id) pairs already emitted
 
         for item in post_items:
             post_url = item.get("url") or item.get("inputUrl")
@@ -1324,46 +1741,57 @@ class InstagramScraperPipeline:
                 latest_comments = item.get("latestComments", [])
                 comments.extend(latest_comments[:max_comments])
 
+            comment_rows = []
             if comments:
                 for comment in comments:
-                    owner = comment.get("owner", {})
-                    user = comment.get("user", {})
-
-                    comment_record = {
-                        **base_record,
-                        "comment_id": comment.get("id") or comment.get("pk"),
-                        "comment_text": comment.get("text"),
-                        "comment_username": owner.get("username")
-                        or user.get("username")
-                        or comment.get("ownerUsername"),
-                        "comment_full_name": owner.get("full_name")
-                        or user.get("full_name"),
-                        "comment_likes": comment.get("likesCount")
-                        or comment.get("comment_like_count"),
-                        "comment_date": comment.get("timestamp")
-                        or comment.get("created_at"),
-                        "comment_replies_count": comment.get("repliesCount")
-                        or comment.get("child_comment_count"),
-                    }
-                    unified_records.append(comment_record)
-            else:
-                unified_records.append(
-                    {
-                        **base_record,
-                        "comment_id": None,
-                        "comment_text": None,
-                        "comment_username": None,
-                        "comment_full_name": None,
-                        "comment_likes": None,
-                        "comment_date": None,
-                        "comment_replies_count": None,
-                    }
-                )
+                    comment_id = comment.get("id") or comment.get("pk")
+                    key = (post_url, comment_id)
+                    if comment_id and key in seen:
+                        continue
+                    seen.add(key)
 
-        df = pd.DataFrame(unified_records)
+                    owner_username, owner_full_name = _user_fields(
+                        comment.get("owner") or {}
+                    )
+                    user_username, user_full_name = _user_fields(
+                        comment.get("user") or {}
+                    )
+
+                    # Plain tuples in _POST_URL_COMMENT_KEYS order; transposed
+                    # into columns once per post below
+                    comment_rows.append(
+                        (
+                            comment_id,
+                            comment.get("text"),
+                            owner_username
+                            or user_username
+                            or comment.get("ownerUsername"),
+                            owner_full_name or user_full_name,
+                            _first_present(
+                                comment.get("likesCount"),
+                                comment.get("comment_like_count"),
+                            ),
+                            comment.get("timestamp") or comment.get("created_at"),
+                            _first_present(
+                                comment.get("repliesCount"),
+                                comment.get("child_comment_count"),
+                            ),
+                        )
+                    )
+                row_columns = dict(
+                    zip(_POST_URL_COMMENT_KEYS, map(list, zip(*comment_rows)))
+                )
+                _extend_columns(columns, base_record, row_columns, len(comment_rows))
+            elif (post_url, None) not in seen:
+                seen.add((post_url, None))
+                _extend_columns(
+                    columns,
+                    base_record,
+                    {key: [None] for key in _POST_URL_COMMENT_KEYS},
+                    1,
+                )
 
-        if "comment_id" in df.columns:
-            df = df.drop_duplicates(subset=["post_url", "comment_id"], keep="first")
+        df = pd.DataFrame(columns)
 
         unique_posts = df["post_url"].nunique()
         total_comments = df[df["comment_id"].notna()].shape[0]
@@ -1377,14 +1805,46 @@ class InstagramScraperPipeline:
 
         return df
 
-    def save_final_data(self, df, name_prefix):
-        """Save final processed data with sentiment analysis"""
+    def save_final_data(self, df, name_prefix, output_format="csv"):
+        """
+        Save final processed data with sentiment analysis.
+        output_format: "csv" (default) or "parquet" (Snappy-compressed, needs pyarrow)
+        """
         if df.empty:
             return None
 
-        # Apply sentiment analysis
+        # Apply sentiment analysis (adds the sentiment columns to df itself,
+        # which callers such as the Streamlit app read afterwards)
         df = self._apply_sentiment_analysis(df)
 
+        if output_format == "parquet":
+            output_file = self.final_dir / f"{name_prefix}_{self.timestamp}.parquet"
+            # Low-cardinality columns repeat on every comment row; write them
+            # dictionary-encoded from a categorical copy so the caller's frame
+            # keeps its own dtypes. CSV gains nothing from this, so it's skipped.
+            categorical_df = df.astype(
+                {
+                    col: "category"
+                    for col in (
+                        "source_type",
+                        "source_value",
+                        "post_type",
+                        "profile_username",
+                        "post_username",
+                        "comment_username",
+                    )
+                    if col in df.columns
+                }
+            )
+            try:
+                categorical_df.to_parquet(
+                    output_file, engine="pyarrow", compression="snappy", index=False
+                )
+                print(f"\n💾 Data saved to: {output_file}")
+                return output_file
+            except Exception as e:
+                print(f"⚠️  Parquet export failed ({e}), falling back to CSV")
+
         # Save to CSV
         output_file = self.final_dir / f"{name_prefix}_{self.timestamp}.csv"
         df.to_csv(output_file, index=False, encoding="utf-8-sig")
@@ -1396,11 +1856,14 @@ class InstagramScraperPipeline:
 # -------------------------
 # Main Function (Renamed)
 # -------------------------
-def run_instagram_scraper():
-    """Run Instagram scraper - refactored to match Facebook scraper structure"""
-    load_dotenv()
-
-    logging.info("=== Comprehensive Instagram Scraper Started ===")
+def run_instagram_scraper(use_cache=True, output_format="csv"):
+    """
+    Run Instagram scraper - refactored to match Facebook scraper structure
+    use_cache: reuse actor results cached in the last 6 hours
+    output_format: "csv" (default) or "parquet", passed to save_final_data
+    """
+    _configure_instagram_logging()
+    logger.info("=== Comprehensive Instagram Scraper Started ===")
 
     print("\n" + "=" * 70)
     print("INSTAGRAM SCRAPER".center(70))
@@ -1410,10 +1873,10 @@ def run_instagram_scraper():
     if not API_TOKEN:
         API_TOKEN = input("Enter Apify API token: ").strip()
         if not API_TOKEN:
-            logging.error("No API token provided. Exiting.")
+            logger.error("No API token provided. Exiting.")
             return
 
-    scraper = InstagramScraperPipeline(API_TOKEN)
+    scraper = InstagramScraperPipeline(API_TOKEN, use_cache=use_cache)
 
     while True:
         print("\n" + "=" * 70)
@@ -1460,7 +1923,9 @@ def run_instagram_scraper():
             )
 
             if not df_result.empty:
-                output_file = scraper.save_final_data(df_result, f"profile_{username}")
+                output_file = scraper.save_final_data(
+                    df_result, f"profile_{username}", output_format
+                )
 
                 # Ask to view dashboard
                 if output_file:
@@ -1501,7 +1966,9 @@ def run_instagram_scraper():
             )
 
             if not df_result.empty:
-                output_file = scraper.save_final_data(df_result, f"keyword_{keyword}")
+                output_file = scraper.save_final_data(
+                    df_result, f"keyword_{keyword}", output_format
+                )
 
                 # Ask to view dashboard
                 if output_file:
@@ -1541,7 +2008,9 @@ def run_instagram_scraper():
             )
 
             if not df_result.empty:
-                output_file = scraper.save_final_data(df_result, "post_urls")
+                output_file = scraper.save_final_data(
+                    df_result, "post_urls", output_format
+                )
 
                 # Ask to view dashboard
                 if output_file:
@@ -1554,7 +2023,7 @@ def run_instagram_scraper():
         elif choice == "4":
             print("\n" + "=" * 70)
             print("👋 Exiting Instagram scraper...")
-            logging.info("=== Exiting Instagram Scraper ===")
+            logger.info("=== Exiting Instagram Scraper ===")
             print("=" * 70)
             break
 
@@ -1568,26 +2037,96 @@ def run_instagram_scraper():
 # TWITTER SCRAPER (from twitter_scraper_combined.py)
 # ============================================================================
 
-from apify_client import ApifyClient
-import json
-from datetime import datetime
-import os
-import pandas as pd
-from pathlib import Path
-from dotenv import load_dotenv
 
-from sentiment_twitter import TwitterSentimentAnalyzer
-from dashboard_twitter import run_twitter_dashboard
+twitter_logger = logging.getLogger(__name__ + ".twitter")
+# Keep Twitter detail off the console even when no log file is attached
+twitter_logger.propagate = False
 
-# Load environment variables
-load_dotenv()
+
+def _configure_twitter_logging(log_dir):
+    """
+    Attach the Twitter log file handler (log_dir/twitter_scraper.log) once per
+    process. Detail stays off the console, which only gets one line per tweet.
+    """
+    if twitter_logger.handlers:
+        return
+    handler = logging.FileHandler(
+        Path(log_dir) / "twitter_scraper.log", mode="a", encoding="utf-8"
+    )
+    handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+    twitter_logger.addHandler(handler)
+    twitter_logger.setLevel(logging.INFO)
+
+
+# Final frames are built in one shot from column lists (see _build_rows_df).
+# Don't grow a DataFrame inside a loop with pd.concat or .loc: each call copies
+# everything so far. If per-tweet frames are ever needed, collect them in a
+# list and pd.concat(frames, ignore_index=True) once at the end.
+
+# Column order of the final Twitter CSV
+TWITTER_FINAL_COLUMNS = (
+    "tweet_id",
+    "interaction_type",
+    "username",
+    "name",
+    "verified",
+    "followers",
+    "text",
+    "reply_url",
+    "tweet_text",
+    "profile_username",
+    "profile_fullname",
+    "profile_followers",
+    "profile_url",
+    "tweet_url",
+    "retweet_count",
+    "reply_count",
+    "like_count",
+    "quote_count",
+    "created_at",
+)
+
+# Nullable dtypes applied to the final Twitter frame
+TWITTER_FINAL_DTYPES = {
+    "verified": "boolean",
+    "followers": "Int64",
+    "profile_followers": "Int64",
+    "retweet_count": "Int64",
+    "reply_count": "Int64",
+    "like_count": "Int64",
+    "quote_count": "Int64",
+}
+
+# (final column, source key) pairs read from each reply / retweeter dict
+TWITTER_REPLY_FIELDS = (
+    ("username", "author_username"),
+    ("name", "author_name"),
+    ("verified", "author_verified"),
+    ("followers", "author_followers"),
+    ("text", "text"),
+    ("reply_url", "tweet_url"),
+    ("retweet_count", "retweet_count"),
+    ("reply_count", "reply_count"),
+    ("like_count", "like_count"),
+    ("quote_count", "quote_count"),
+    ("created_at", "created_at"),
+)
+TWITTER_RETWEETER_FIELDS = (
+    ("username", "userName"),
+    ("name", "name"),
+    ("verified", "isVerified"),
+    ("followers", "followers"),
+)
 
 
 class TwitterScraperPipeline:
     """Complete Twitter scraping pipeline with profile, replies, and retweets support."""
 
-    def __init__(self, api_token):
-        self.client = ApifyClient(api_token)
+    def __init__(self, api_token, sentiment_analyzer=None):
+        self.client = _apify_client(api_token)
+        # One sentiment analyzer per pipeline, so its text cache carries over
+        # between saves; callers may pass in one shared across pipelines
+        self.sentiment_analyzer = sentiment_analyzer or TwitterSentimentAnalyzer()
 
         # Actor IDs
         self.profile_actor_id = "web.harvester/twitter-scraper"
@@ -1596,12 +2135,24 @@ class TwitterScraperPipeline:
 
         # Directories
         Twitter_output_dir = Path("Data/Twitter")
+        self.output_dir = Twitter_output_dir
         self.preprocessing_dir = Twitter_output_dir / "preprocessing"
         self.final_dir = Twitter_output_dir / "final"
 
         self.preprocessing_dir.mkdir(parents=True, exist_ok=True)
         self.final_dir.mkdir(parents=True, exist_ok=True)
 
+        # Output file name templates, resolved once instead of per save
+        self._raw_path_fmt = os.path.join(
+            self.preprocessing_dir, "{username}_raw_{timestamp}.json"
+        )
+        self._final_path_fmt = os.path.join(
+            self.final_dir, "{username}_all_tweets_{timestamp}"
+        )
+
+        # Profile actor item per profile URL; only tweet_url depends on the tweet
+        self._profile_cache = {}
+
         print("Twitter Scraper initialized")
 
     def scrape_from_user(
@@ -1643,22 +2194,30 @@ class TwitterScraperPipeline:
         all_data = []
 
         # Process each tweet ID
-        for tid in tweet_ids:
-            print(f"\n{'='*70}")
-            print(f"🔍 Processing Tweet ID: {tid} (username: @{username})")
-            print(f"{'='*70}")
-
-            # Step 1: Fetch profile info + main tweet
-            print("📊 Step 1/3: Fetching profile info...")
-            profile_info = self._fetch_profile_info(profile_url, username, tid)
-
-            # Step 2: Scrape replies
-            print(f"\n💬 Step 2/3: Scraping up to {max_replies} replies...")
-            replies_list = self._scrape_replies(tid, max_replies)
+        # One console line per tweet; per-step detail goes to the Twitter log
+        # file only
+        for n, tid in enumerate(tweet_ids, 1):
+            print(f"🔍 Tweet {n}/{len(tweet_ids)}: {tid} (@{username})")
+            twitter_logger.info(
+                "Tweet %s: profile, up to %d replies, up to %d retweeters",
+                tid,
+                max_replies,
+                max_retweets,
+            )
 
-            # Step 3: Scrape retweeters
-            print(f"\n🔄 Step 3/3: Scraping up to {max_retweets} retweeters...")
-            retweets_list = self._scrape_retweeters(tid, max_retweets)
+            # Steps 1-3 hit independent actors, so run them concurrently and
+            # wait on all three instead of paying each actor's latency in turn
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                profile_future = executor.submit(
+                    self._fetch_profile_info, profile_url, username, tid
+                )
+                replies_future = executor.submit(self._scrape_replies, tid, max_replies)
+                retweets_future = executor.submit(
+                    self._scrape_retweeters, tid, max_retweets
+                )
+                profile_info = profile_future.result()
+                replies_list = replies_future.result()
+                retweets_list = retweets_future.result()
 
             # Combine for this tweet
             all_data.append(
@@ -1670,7 +2229,7 @@ class TwitterScraperPipeline:
                 }
             )
 
-            print(f"\n✅ Completed processing Tweet ID: {tid}")
+            twitter_logger.info("Completed tweet %s", tid)
 
         # Calculate totals
         total_replies = sum(len(t.get("replies", [])) for t in all_data)
@@ -1698,43 +2257,48 @@ class TwitterScraperPipeline:
     # ------------------------
 
     def _run_actor_and_get_items(self, actor_id, run_input):
-        """Run an actor and return dataset items list."""
+        """
+        Run an actor and yield its dataset items one at a time, so callers can
+        project each raw item and let it go instead of holding the whole list.
+        """
         try:
             run = self.client.actor(actor_id).call(run_input=run_input)
         except Exception as e:
             print(f"Error running actor {actor_id}: {e}")
-            return []
+            return
 
         dataset_id = run.get("defaultDatasetId")
         if not dataset_id:
-            return []
+            return
 
         try:
-            items = list(self.client.dataset(dataset_id).iterate_items())
+            yield from self.client.dataset(dataset_id).iterate_items()
         except Exception as e:
             print(
                 f"Error fetching dataset {dataset_id} items for actor {actor_id}: {e}"
             )
-            return []
-
-        return items
 
     def _fetch_profile_info(self, profile_url, username, tweet_id):
-        """Fetch profile info and main tweet data."""
-        profile_items = self._run_actor_and_get_items(
-            self.profile_actor_id,
-            {
-                "startUrls": [{"url": profile_url}],
-                "tweetsDesired": 1,
-                "includeUserInfo": True,
-            },
-        )
+        """Fetch profile info and main tweet data (one actor run per profile)."""
+        item = self._profile_cache.get(profile_url)
+        if item is None:
+            item = next(
+                self._run_actor_and_get_items(
+                    self.profile_actor_id,
+                    {
+                        "startUrls": [{"url": profile_url}],
+                        "tweetsDesired": 1,
+                        "includeUserInfo": True,
+                    },
+                ),
+                None,
+            )
 
-        if not profile_items:
-            print(f"⚠️  Warning: no profile info returned for @{username}.")
-            return {}
+            if not item:
+                print(f"⚠️  Warning: no profile info returned for @{username}.")
+                return {}
+            self._profile_cache[profile_url] = item
 
-        item = profile_items[0]
         pdata = item.get("user", {}) or {}
         profile_info = {
             "id": item.get("id"),
@@ -1750,8 +2314,8 @@ class TwitterScraperPipeline:
             },
             "tweet_text": item.get("text") or item.get("tweetText") or "",
         }
-        print(
-            f"✅ Profile fetched: {profile_info['user'].get('totalFollowers')} followers"
+        twitter_logger.info(
+            "Profile fetched: %s followers", profile_info["user"].get("totalFollowers")
         )
         return profile_info
 
@@ -1765,36 +2329,42 @@ class TwitterScraperPipeline:
         replies_list = []
         for r in replies:
             author = r.get("author", {}) or {}
+            reply_id = r.get("id")
+            author_username = author.get("userName")
             replies_list.append(
                 {
-                    "tweet_id": r.get("id"),
+                    "tweet_id": reply_id,
                     "text": r.get("text"),
                     "created_at": r.get("createdAt"),
-                    "author_username": author.get("userName"),
+                    "author_username": author_username,
                     "author_name": author.get("name"),
-                    "author_verified": (
-                        author.get("isVerified")
-                        if author.get("isVerified") is not None
-                        else author.get("verified")
+                    "author_verified": _first_present(
+                        author.get("isVerified"), author.get("verified")
                     ),
                     "author_followers": author.get("followers"),
                     "author_following": author.get("following"),
-                    "retweet_count": r.get("retweetCount") or r.get("retweets"),
-                    "reply_count": r.get("replyCount") or r.get("replies"),
-                    "like_count": r.get("likeCount") or r.get("likes"),
-                    "quote_count": r.get("quoteCount") or r.get("quotes"),
+                    "retweet_count": _first_present(
+                        r.get("retweetCount"), r.get("retweets")
+                    ),
+                    "reply_count": _first_present(
+                        r.get("replyCount"), r.get("replies")
+                    ),
+                    "like_count": _first_present(r.get("likeCount"), r.get("likes")),
+                    "quote_count": _first_present(r.get("quoteCount"), r.get("quotes")),
                     "is_reply": r.get("isReply"),
                     "in_reply_to_id": r.get("inReplyToId")
                     or r.get("inReplyToStatusId"),
                     "tweet_url": (
-                        f"https://x.com/{author.get('userName')}/status/{r.get('id')}"
-                        if author.get("userName") and r.get("id")
+                        f"https://x.com/{author_username}/status/{reply_id}"
+                        if author_username and reply_id
                         else None
                     ),
                 }
             )
 
-        print(f"✅ Scraped {len(replies_list)} replies")
+        twitter_logger.info(
+            "Scraped %d replies for tweet %s", len(replies_list), tweet_id
+        )
         return replies_list
 
     def _scrape_retweeters(self, tweet_id, max_retweets):
@@ -1819,7 +2389,9 @@ class TwitterScraperPipeline:
                 }
             )
 
-        print(f"✅ Scraped {len(retweets_list)} retweeters")
+        twitter_logger.info(
+            "Scraped %d retweeters for tweet %s", len(retweets_list), tweet_id
+        )
         return retweets_list
 
     # ------------------------
@@ -1828,16 +2400,29 @@ class TwitterScraperPipeline:
 
     def _save_raw_data(self, data, username, timestamp):
         """Save raw/preprocessed data."""
-        json_file = self.preprocessing_dir / f"{username}_raw_{timestamp}.json"
-        with open(json_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        json_file = Path(
+            self._raw_path_fmt.format(username=username, timestamp=timestamp)
+        )
+        with open(json_file, "wb") as f:
+            f.write(_json_dumps(data, indent=True))
 
         print(f"\n💾 Preprocessing JSON saved: {json_file}")
         return json_file
 
-    def _process_and_save_final(self, data, username, timestamp):
-        """Process and save final CSV/JSON with sentiment analysis."""
-        rows = []
+    def _build_rows_df(self, data):
+        """
+        Build the final one-row-per-interaction DataFrame for all tweets in a
+        single construction (None if there are no replies or retweeters).
+        """
+        # The first reply doubles as the main tweet text, so it is not a row
+        total = sum(max(len(t["replies"]) - 1, 0) + len(t["retweeters"]) for t in data)
+        if not total:
+            return None
+
+        # Fill preallocated column lists by position instead of building a
+        # dict per row; unset cells stay None
+        cols = {name: [None] * total for name in TWITTER_FINAL_COLUMNS}
+        start = 0
 
         for tweet_data in data:
             tid = tweet_data["tweet_id"]
@@ -1855,76 +2440,71 @@ class TwitterScraperPipeline:
             else:
                 main_tweet_text = tweet_data["profile_info"].get("tweet_text", "")
 
+            n_replies = len(replies_list)
+            n_rows = n_replies + len(retweeters_list)
+            mid, end = start + n_replies, start + n_rows
+
+            # Per-tweet values shared by every row of this tweet
+            for name, value in (
+                ("tweet_id", tid),
+                ("tweet_text", main_tweet_text),
+                ("profile_username", profile.get("username")),
+                ("profile_fullname", profile.get("userFullName")),
+                ("profile_followers", profile.get("totalFollowers")),
+                ("profile_url", profile_link),
+                ("tweet_url", tweet_link),
+            ):
+                cols[name][start:end] = [value] * n_rows
+
             # Add replies
-            for r in replies_list:
-                rows.append(
-                    {
-                        "tweet_id": tid,
-                        "interaction_type": "reply",
-                        "username": r.get("author_username"),
-                        "name": r.get("author_name"),
-                        "verified": r.get("author_verified"),
-                        "followers": r.get("author_followers"),
-                        "text": r.get("text"),
-                        "reply_url": r.get("tweet_url"),
-                        "tweet_text": main_tweet_text,
-                        "profile_username": profile.get("username"),
-                        "profile_fullname": profile.get("userFullName"),
-                        "profile_followers": profile.get("totalFollowers"),
-                        "profile_url": profile_link,
-                        "tweet_url": tweet_link,
-                        "retweet_count": r.get("retweet_count"),
-                        "reply_count": r.get("reply_count"),
-                        "like_count": r.get("like_count"),
-                        "quote_count": r.get("quote_count"),
-                        "created_at": r.get("created_at"),
-                    }
-                )
+            cols["interaction_type"][start:mid] = ["reply"] * n_replies
+            for name, key in TWITTER_REPLY_FIELDS:
+                cols[name][start:mid] = [r.get(key) for r in replies_list]
 
-            # Add retweeters
-            for r in retweeters_list:
-                rows.append(
-                    {
-                        "tweet_id": tid,
-                        "interaction_type": "retweeter",
-                        "username": r.get("userName"),
-                        "name": r.get("name"),
-                        "verified": r.get("isVerified"),
-                        "followers": r.get("followers"),
-                        "text": "",
-                        "reply_url": "",
-                        "tweet_text": main_tweet_text,
-                        "profile_username": profile.get("username"),
-                        "profile_fullname": profile.get("userFullName"),
-                        "profile_followers": profile.get("totalFollowers"),
-                        "profile_url": profile_link,
-                        "tweet_url": tweet_link,
-                        "retweet_count": None,
-                        "reply_count": None,
-                        "like_count": None,
-                        "quote_count": None,
-                        "created_at": None,
-                    }
-                )
+            # Add retweeters (no text or engagement counts of their own)
+            cols["interaction_type"][mid:end] = ["retweeter"] * (end - mid)
+            cols["text"][mid:end] = [""] * (end - mid)
+            cols["reply_url"][mid:end] = [""] * (end - mid)
+            for name, key in TWITTER_RETWEETER_FIELDS:
+                cols[name][mid:end] = [r.get(key) for r in retweeters_list]
 
-        if not rows:
-            return None
+            start = end
 
         # Create DataFrame
-        df = pd.DataFrame(rows)
+        df = pd.DataFrame(cols)
+
+        # Compact dtypes: two-valued interaction_type as a categorical, flags and
+        # counts as nullable types (retweeter rows have no counts)
+        df["interaction_type"] = df["interaction_type"].astype("category")
+        for col, dtype in TWITTER_FINAL_DTYPES.items():
+            try:
+                df[col] = df[col].astype(dtype)
+            except (TypeError, ValueError):
+                pass  # leave unexpected API values as they came
+
+        return df
+
+    def _process_and_save_final(self, data, username, timestamp):
+        """Process and save final CSV/JSON with sentiment analysis."""
+        df = self._build_rows_df(data)
+        if df is None:
+            return None
 
         # Apply sentiment analysis
         if not df.empty:
             df = self._apply_sentiment_analysis(df)
 
         # Save final files
-        json_file = self.final_dir / f"{username}_all_tweets_{timestamp}.json"
-        csv_file = self.final_dir / f"{username}_all_tweets_{timestamp}.csv"
+        final_stem = self._final_path_fmt.format(username=username, timestamp=timestamp)
+        json_file = Path(final_stem + ".json")
+        csv_file = Path(final_stem + ".csv")
+
+        with open(json_file, "wb") as f:
+            f.write(_json_dumps(data, indent=True))
 
-        with open(json_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        _write_csv(df, csv_file)
 
-        df.to_csv(csv_file, index=False, encoding="utf-8-sig")
+        interaction_counts = df["interaction_type"].value_counts()
 
         print(f"\n{'='*70}")
         print(f"✅ SCRAPING COMPLETE!")
@@ -1932,8 +2512,8 @@ class TwitterScraperPipeline:
         print(f"💾 Final Combined JSON saved: {json_file}")
         print(f"💾 Final Combined CSV  saved: {csv_file}")
         print(f"   • Total rows: {len(df)}")
-        print(f"   • Replies: {len(df[df['interaction_type'] == 'reply'])}")
-        print(f"   • Retweeters: {len(df[df['interaction_type'] == 'retweeter'])}")
+        print(f"   • Replies: {interaction_counts.get('reply', 0)}")
+        print(f"   • Retweeters: {interaction_counts.get('retweeter', 0)}")
         print(f"{'='*70}\n")
 
         return csv_file
@@ -1948,8 +2528,7 @@ class TwitterScraperPipeline:
             print("🤖 APPLYING SENTIMENT ANALYSIS...")
             print("=" * 70)
 
-            analyzer = TwitterSentimentAnalyzer()
-            df = analyzer.analyze_twitter_data(df)
+            df = self.sentiment_analyzer.analyze_twitter_data(df)
 
             print("✅ Sentiment analysis completed!")
             print("=" * 70 + "\n")
@@ -1978,6 +2557,7 @@ def run_twitter_scraper():
         return
 
     scraper = TwitterScraperPipeline(API_TOKEN)
+    _configure_twitter_logging(scraper.output_dir)
 
     # Get user input
     user_input = input(
@@ -2073,7 +2653,27 @@ def run_twitter_scraper():
 # ============================================================================
 # MAIN PROGRAM
 # ============================================================================
-def main():
+def parse_args(argv=None):
+    """Parse command-line options for the interactive scraper."""
+    parser = argparse.ArgumentParser(description="Unified Social Media Scraper")
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="ignore cached Instagram actor results and force fresh runs",
+    )
+    parser.add_argument(
+        "--parquet",
+        dest="output_format",
+        action="store_const",
+        const="parquet",
+        default="csv",
+        help="save final Instagram data as Parquet instead of CSV",
+    )
+    return parser.parse_args(argv)
+
+
+def main(use_cache=True, output_format="csv"):
     """Main program loop"""
     while True:
         print_banner()
@@ -2082,7 +2682,7 @@ def main():
         if choice == "1":
             run_facebook_scraper()
         elif choice == "2":
-            run_instagram_scraper()
+            run_instagram_scraper(use_cache, output_format)
         elif choice == "3":
             run_twitter_scraper()
         elif choice == "4":
@@ -2096,4 +2696,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    main(use_cache=args.use_cache, output_format=args.output_format)
@@ -0,0 +1,348 @@
+from collections import OrderedDict
+from functools import lru_cache
+import os
+
+from transformers import AutoModelForSequenceClassification, AutoTokenizer
+import numpy as np
+import pandas as pd
+
+try:
+    import torch
+except ImportError:
+    torch = None
+
+try:
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+except ImportError:
+    ORTModelForSequenceClassification = None
+
+# Exported ONNX copy of the model, written on first use
+DEFAULT_ONNX_MODEL_DIR = os.path.join("Data", "models", "onnx")
+
+DEVICE_NAMES = {"cuda": "GPU (fp16)", "mps": "Apple MPS", "cpu": "CPU"}
+
+
+def _select_device():
+    """
+    Pick the fastest available torch device: CUDA, then MPS, then CPU.
+    """
+    if torch is None:
+        return "cpu"
+    if torch.cuda.is_available():
+        return "cuda"
+    if torch.backends.mps.is_available():
+        return "mps"
+    return "cpu"
+
+
+def _configure_torch_threads():
+    """
+    Use every core inside each op, but no extra inter-op threads.
+    """
+    if torch is None:
+        return
+    torch.set_num_threads(os.cpu_count())
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # Only settable once per process
+
+
+def _load_torch_model(model_name, device="cpu"):
+    """
+    Load the PyTorch model onto device (in fp16 on CUDA) with the encoder
+    on the fused scaled_dot_product_attention kernels, falling back to the
+    default attention where the installed torch doesn't support them.
+    """
+    dtype_kwargs = {"torch_dtype": torch.float16} if device == "cuda" else {}
+    try:
+        model = AutoModelForSequenceClassification.from_pretrained(
+            model_name, attn_implementation="sdpa", **dtype_kwargs
+        )
+    except (ValueError, ImportError):
+        model = AutoModelForSequenceClassification.from_pretrained(
+            model_name, **dtype_kwargs
+        )
+    return model.to(device).eval()
+
+
+def _load_onnx_model(model_name, onnx_model_dir, quantize=True):
+    """
+    Load the ONNX Runtime model in onnx_model_dir: model_quantized.onnx with
+    quantize, model.onnx otherwise. Whichever file is missing is created on
+    first use, exporting model.onnx from model_name and quantizing it to int8
+    next to it.
+    """
+    quantized_file = "model_quantized.onnx"
+    if quantize and os.path.exists(os.path.join(onnx_model_dir, quantized_file)):
+        return ORTModelForSequenceClassification.from_pretrained(
+            onnx_model_dir, file_name=quantized_file
+        )
+
+    if not os.path.exists(os.path.join(onnx_model_dir, "model.onnx")):
+        print(f"  Exporting model to ONNX: {onnx_model_dir}")
+        model = ORTModelForSequenceClassification.from_pretrained(
+            model_name, export=True
+        )
+        model.save_pretrained(onnx_model_dir)
+
+    if not quantize:
+        return ORTModelForSequenceClassification.from_pretrained(
+            onnx_model_dir, file_name="model.onnx"
+        )
+
+    print("  Quantizing ONNX model to int8...")
+    quantizer = ORTQuantizer.from_pretrained(onnx_model_dir, file_name="model.onnx")
+    quantizer.quantize(
+        save_dir=onnx_model_dir,
+        quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False),
+    )
+    return ORTModelForSequenceClassification.from_pretrained(
+        onnx_model_dir, file_name=quantized_file
+    )
+
+
+def load_model(model_name, onnx_model_dir=None, quantize=True, compile_model=False):
+    """
+    Load the tokenizer and model once per process, so the Facebook, Instagram
+    and Twitter analyzers share one copy of the same checkpoint. Arguments are
+    passed on positionally in full, so every call form hits the same cache
+    entry.
+    Runs on a CUDA GPU (fp16) or Apple MPS when one is available. Otherwise,
+    with optimum[onnxruntime] installed, the ONNX Runtime model in
+    onnx_model_dir (default: SENTIMENT_ONNX_MODEL_DIR, then Data/models/onnx)
+    is used in place of PyTorch.
+    compile_model wraps the PyTorch model in torch.compile; callers should
+    pad batches to a few fixed shapes so compiled graphs get reused.
+    Returns: (tokenizer, model, device_description)
+    """
+    # The analyzers tokenize to PyTorch tensors and run under
+    # torch.inference_mode even on the ONNX Runtime path
+    if torch is None:
+        raise ImportError(
+            "Sentiment analysis needs PyTorch; install it with: pip install torch"
+        )
+    return _load_model_cached(model_name, onnx_model_dir, quantize, compile_model)
+
+
+@lru_cache(maxsize=4)
+def _load_model_cached(model_name, onnx_model_dir, quantize, compile_model):
+    _configure_torch_threads()
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+
+    device = _select_device()
+    if device == "cpu" and ORTModelForSequenceClassification is not None:
+        onnx_model_dir = (
+            onnx_model_dir
+            or os.getenv("SENTIMENT_ONNX_MODEL_DIR")
+            or DEFAULT_ONNX_MODEL_DIR
+        )
+        model = _load_onnx_model(model_name, onnx_model_dir, quantize)
+        precision = "int8" if quantize else "fp32"
+        return tokenizer, model, f"CPU (ONNX Runtime {precision}, {onnx_model_dir})"
+
+    model = _load_torch_model(model_name, device)
+    if compile_model and hasattr(torch, "compile"):
+        model = torch.compile(model, mode="reduce-overhead", fullgraph=False)
+        return tokenizer, model, f"{DEVICE_NAMES[device]}, torch.compile"
+    return tokenizer, model, DEVICE_NAMES[device]
+
+
+def results_to_columns(results):
+    """
+    Split model results into a categorical label array and a float32 score
+    array, ready to assign as dataframe columns. Labels only take a handful
+    of values, so the categorical is far smaller than a column of strings.
+    """
+    labels = np.fromiter(
+        (r["label"] for r in results), dtype=object, count=len(results)
+    )
+    scores = np.fromiter(
+        (r["score"] for r in results), dtype=np.float32, count=len(results)
+    )
+    return pd.Categorical(labels), scores
+
+
+def format_counts(values, sort_labels=True):
+    """
+    Format a column's value counts as "• value: count (pct%)" lines with the
+    percentage of all rows in values, sorted by value unless sort_labels is
+    False (then most common first).
+    """
+    counts = values.value_counts()
+    counts = counts[counts > 0]  # Unused categories of categorical columns
+    if sort_labels:
+        counts = counts.sort_index()
+    percentages = counts.to_numpy() / len(values) * 100
+    return "\n".join(
+        f"     • {value}: {count} ({percentage:.1f}%)"
+        for value, count, percentage in zip(
+            counts.index, counts.to_numpy(), percentages
+        )
+    )
+
+
+class BaseSentimentAnalyzer:
+    """
+    Model loading, caching and batched inference shared by the Facebook,
+    Instagram and Twitter analyzers; subclasses set platform and add their
+    dataframe logic.
+    """
+
+    platform = "Text"
+
+    def __init__(
+        self,
+        model_name="cardiffnlp/twitter-roberta-base-sentiment-latest",
+        batch_size=32,
+        onnx_model_dir=None,
+        quantize=True,
+        cache_size=10000,
+        compile_model=False,
+    ):
+        """
+        Initialize sentiment analyzer with 3-class sentiment model.
+        Model outputs: POSITIVE, NEUTRAL, NEGATIVE
+        The model is loaded on first use, once per process, and shared
+        between analyzers.
+        batch_size: number of texts per model forward pass
+        onnx_model_dir: where the ONNX Runtime copy of the model lives when
+            optimum[onnxruntime] is installed and no GPU is found
+        quantize: run an int8 dynamically quantized copy of the ONNX model;
+            set False to keep full fp32 accuracy
+        cache_size: how many distinct texts keep their results between calls
+        compile_model: run the PyTorch model through torch.compile, padding
+            batches to multiples of 32 tokens so compiled shapes are reused
+        """
+        print(f"Initializing {self.platform} sentiment analyzer...")
+        self.batch_size = batch_size
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self.pad_to_multiple_of = 32 if compile_model else None
+
+        self._model_args = (model_name, onnx_model_dir, quantize, compile_model)
+        self._tokenizer = None
+        self._model = None
+
+    @property
+    def tokenizer(self):
+        if self._tokenizer is None:
+            self._load()
+        return self._tokenizer
+
+    @property
+    def model(self):
+        if self._model is None:
+            self._load()
+        return self._model
+
+    def _load(self):
+        """
+        Load the tokenizer and model. Deferred until the first text needs
+        scoring, so frames with nothing to analyze never pay for the load;
+        the CSV entry points call it early to overlap it with the file read.
+        """
+        print(f"Loading model: {self._model_args[0]}")
+        self._tokenizer, self._model, device_name = load_model(*self._model_args)
+        print(f"  Device: {device_name}")
+        print("✅ Sentiment analyzer ready!")
+
+    def analyze_text_batch(self, texts, text_type="text"):
+        """
+        Analyze a batch of texts and return sentiment results.
+        Each distinct non-empty text is run through the model once, reusing
+        results cached by earlier calls; empty texts and texts that fail get
+        NEUTRAL with score 0.0.
+        """
+        results = [{"label": "NEUTRAL", "score": 0.0} for _ in texts]
+
+        # Empty-text mask runs as vectorized string ops
+        texts = pd.Series(texts, dtype=object)
+        as_str = texts.astype(str)
+        mask = (texts.notna() & as_str.str.strip().ne("") & as_str.ne("nan")).to_numpy()
+        indices = np.flatnonzero(mask)
+        cleaned_texts = as_str[mask].tolist()
+        if not cleaned_texts:
+            return results
+
+        results_by_text = {}
+        new_texts = []
+        for text in dict.fromkeys(cleaned_texts):
+            if text in self._cache:
+                self._cache.move_to_end(text)
+                results_by_text[text] = self._cache[text]
+            else:
+                new_texts.append(text)
+
+        for text, result in zip(new_texts, self._run_model(new_texts, text_type)):
+            if result is None:
+                results_by_text[text] = {"label": "NEUTRAL", "score": 0.0}
+                continue
+            results_by_text[text] = result
+            self._cache[text] = result
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+        for i, text in zip(indices, cleaned_texts):
+            results[i] = results_by_text[text]
+        return results
+
+    def _run_model(self, texts, text_type="text"):
+        """
+        Run the model over texts in mini-batches and return one result per
+        text, all under torch.inference_mode. If a batch fails, texts are
+        retried one at a time and those that still fail come back as None.
+        """
+        if not texts:
+            return []
+        # Load outside the try below, so a load failure is raised once instead
+        # of being retried per text and turning every row NEUTRAL
+        if self._model is None:
+            self._load()
+        with torch.inference_mode():
+            try:
+                # Batch texts of similar length together so each batch pads to
+                # a short maximum, then restore the caller's order
+                order = np.argsort([len(text) for text in texts], kind="stable")
+                sorted_texts = [texts[i] for i in order]
+                results = []
+                for start in range(0, len(sorted_texts), self.batch_size):
+                    results.extend(
+                        self._predict(sorted_texts[start : start + self.batch_size])
+                    )
+                return [results[i] for i in np.argsort(order)]
+            except Exception as e:
+                print(
+                    f"    ⚠️ Batch analysis failed ({e}), retrying {text_type}s one by one"
+                )
+            results = []
+            for i, text in enumerate(texts):
+                try:
+                    results.append(self._predict([text])[0])
+                except Exception as e:
+                    if i < 5:  # Only print first 5 errors
+                        print(f"    ⚠️ Error analyzing {text_type} {i}: {e}")
+                    results.append(None)
+            return results
+
+    def _predict(self, texts):
+        """
+        Tokenize one mini-batch in a single call, padded to its longest text
+        and truncated to 512 tokens, and classify it in one forward pass.
+        """
+        inputs = self.tokenizer(
+            texts,
+            padding=True,
+            truncation=True,
+            max_length=512,
+            pad_to_multiple_of=self.pad_to_multiple_of,
+            return_tensors="pt",
+        ).to(self.model.device)
+        logits = self.model(**inputs).logits
+        scores, label_ids = torch.softmax(logits, dim=-1).max(dim=-1)
+        id2label = self.model.config.id2label
+        return [
+            {"label": id2label[label_id], "score": score}
+            for label_id, score in zip(label_ids.tolist(), scores.tolist())
+        ]
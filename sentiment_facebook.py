@@ -1,17 +1,19 @@
-from transformers import pipeline
 import pandas as pd
 
+from sentiment_common import BaseSentimentAnalyzer, results_to_columns
 
-class SentimentAnalyzer:
-    def __init__(self, model_name="cardiffnlp/twitter-roberta-base-sentiment-latest"):
+
+class SentimentAnalyzer(BaseSentimentAnalyzer):
+    platform = "Facebook"
+
+    def _analyze_column(self, column, text_type="text"):
         """
-        Initialize sentiment analyzer with 3-class sentiment model.
-        Model outputs: POSITIVE, NEUTRAL, NEGATIVE
+        Analyze a dataframe column and return (labels, scores) arrays, one per
+        row. Post text repeats on every comment row, but analyze_text_batch
+        only runs the model once per distinct text.
         """
-        print("Initializing 3-class sentiment analyzer...")
-        print("Loading model: cardiffnlp/twitter-roberta-base-sentiment-latest")
-        self.analyzer = pipeline("sentiment-analysis", model=model_name)
-        print("✅ Sentiment analyzer ready!")
+        texts = column.fillna("").astype(str).tolist()
+        return results_to_columns(self.analyze_text_batch(texts, text_type))
 
     def analyze_posts_and_comments(
         self, df, post_col="post_message", comment_col="comment_text"
@@ -27,44 +29,28 @@ class SentimentAnalyzer:
 
         # Post sentiment
         print("  → Analyzing post sentiments...")
-        post_texts = df[post_col].fillna("").astype(str).tolist()
-
-        # Filter out empty texts
-        post_results = []
-        for i, text in enumerate(post_texts):
-            if text.strip() == "" or text == "nan":
-                post_results.append({"label": "NEUTRAL", "score": 0.0})
-            else:
-                try:
-                    result = self.analyzer(text[:512], truncation=True)[
-                        0
-                    ]  # Limit text length
-                    post_results.append(result)
-                except Exception as e:
-                    print(f"    ⚠️ Error analyzing post {i}: {e}")
-                    post_results.append({"label": "NEUTRAL", "score": 0.0})
-
-        df["post_sentiment_label"] = [s["label"] for s in post_results]
-        df["post_sentiment_score"] = [s["score"] for s in post_results]
+        post_labels, post_scores = self._analyze_column(df[post_col], "post")
 
         # Comment sentiment
         print("  → Analyzing comment sentiments...")
-        comment_texts = df[comment_col].fillna("").astype(str).tolist()
-
-        comment_results = []
-        for i, text in enumerate(comment_texts):
-            if text.strip() == "" or text == "nan":
-                comment_results.append({"label": "NEUTRAL", "score": 0.0})
-            else:
-                try:
-                    result = self.analyzer(text[:512], truncation=True)[0]
-                    comment_results.append(result)
-                except Exception as e:
-                    print(f"    ⚠️ Error analyzing comment {i}: {e}")
-                    comment_results.append({"label": "NEUTRAL", "score": 0.0})
+        comment_labels, comment_scores = self._analyze_column(
+            df[comment_col], "comment"
+        )
 
-        df["comment_sentiment_label"] = [s["label"] for s in comment_results]
-        df["comment_sentiment_score"] = [s["score"] for s in comment_results]
+        # Attach all four result columns in one concat instead of four inserts
+        sentiment_cols = pd.DataFrame(
+            {
+                "post_sentiment_label": post_labels,
+                "post_sentiment_score": post_scores,
+                "comment_sentiment_label": comment_labels,
+                "comment_sentiment_score": comment_scores,
+            },
+            index=df.index,
+        )
+        df = pd.concat(
+            [df.drop(columns=sentiment_cols.columns, errors="ignore"), sentiment_cols],
+            axis=1,
+        )
 
         # Print summary
         print("\n📊 Sentiment Analysis Summary:")
@@ -1,37 +1,28 @@
-from transformers import pipeline
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 
+from sentiment_common import (
+    BaseSentimentAnalyzer,
+    format_counts,
+    results_to_columns,
+)
 
-class InstagramSentimentAnalyzer:
-    def __init__(self, model_name="cardiffnlp/twitter-roberta-base-sentiment-latest"):
-        """
-        Initialize sentiment analyzer with 3-class sentiment model.
-        Model outputs: POSITIVE, NEUTRAL, NEGATIVE
-        """
-        print("Initializing Instagram sentiment analyzer...")
-        print("Loading model: cardiffnlp/twitter-roberta-base-sentiment-latest")
-        self.analyzer = pipeline("sentiment-analysis", model=model_name)
-        print("✅ Sentiment analyzer ready!")
 
-    def analyze_text_batch(self, texts, text_type="text"):
+class InstagramSentimentAnalyzer(BaseSentimentAnalyzer):
+    platform = "Instagram"
+
+    def analyze_text_column(self, column, text_type="text"):
         """
-        Analyze a batch of texts and return sentiment results.
-        Handles empty texts and errors gracefully.
+        Analyze a dataframe column. Captions repeat on every comment row of a
+        post, but analyze_text_batch only runs the model once per distinct text.
+        Returns: (categorical labels, float32 scores, unique_count)
         """
-        results = []
-        for i, text in enumerate(texts):
-            if pd.isna(text) or str(text).strip() == "" or str(text) == "nan":
-                results.append({"label": "NEUTRAL", "score": 0.0})
-            else:
-                try:
-                    # Truncate to 512 tokens for model
-                    result = self.analyzer(str(text)[:512], truncation=True)[0]
-                    results.append(result)
-                except Exception as e:
-                    if i < 5:  # Only print first 5 errors
-                        print(f"    ⚠️ Error analyzing {text_type} {i}: {e}")
-                    results.append({"label": "NEUTRAL", "score": 0.0})
-        return results
+        texts = column.fillna("").astype(str)
+        labels, scores = results_to_columns(
+            self.analyze_text_batch(texts.tolist(), text_type)
+        )
+        return labels, scores, texts.nunique()
 
     def analyze_instagram_data(self, df):
         """
@@ -58,12 +49,13 @@ class InstagramSentimentAnalyzer:
         # Analyze post captions
         if "post_caption" in df.columns:
             print(f"\n  → Analyzing post captions...")
-            caption_texts = df["post_caption"].fillna("").astype(str).tolist()
-            caption_results = self.analyze_text_batch(caption_texts, "caption")
+            labels, scores, n_unique = self.analyze_text_column(
+                df["post_caption"], "caption"
+            )
 
-            df["caption_sentiment_label"] = [s["label"] for s in caption_results]
-            df["caption_sentiment_score"] = [s["score"] for s in caption_results]
-            print(f"  ✅ Analyzed {len(caption_results)} captions")
+            df["caption_sentiment_label"] = labels
+            df["caption_sentiment_score"] = scores
+            print(f"  ✅ Analyzed {len(df)} captions ({n_unique} unique)")
         else:
             print("  ℹ️  No post_caption column found")
             df["caption_sentiment_label"] = "NEUTRAL"
@@ -74,12 +66,13 @@ class InstagramSentimentAnalyzer:
             # Individual comments in comment_text column
             if "comment_text" in df.columns:
                 print(f"\n  → Analyzing individual comments...")
-                comment_texts = df["comment_text"].fillna("").astype(str).tolist()
-                comment_results = self.analyze_text_batch(comment_texts, "comment")
+                labels, scores, n_unique = self.analyze_text_column(
+                    df["comment_text"], "comment"
+                )
 
-                df["comment_sentiment_label"] = [s["label"] for s in comment_results]
-                df["comment_sentiment_score"] = [s["score"] for s in comment_results]
-                print(f"  ✅ Analyzed {len(comment_results)} comments")
+                df["comment_sentiment_label"] = labels
+                df["comment_sentiment_score"] = scores
+                print(f"  ✅ Analyzed {len(df)} comments ({n_unique} unique)")
             else:
                 print("  ℹ️  No comment_text column found")
                 df["comment_sentiment_label"] = "NEUTRAL"
@@ -89,14 +82,15 @@ class InstagramSentimentAnalyzer:
             # Aggregated comments in all_comments_text column
             if "all_comments_text" in df.columns:
                 print(f"\n  → Analyzing aggregated comments...")
-                comment_texts = df["all_comments_text"].fillna("").astype(str).tolist()
-                comment_results = self.analyze_text_batch(
-                    comment_texts, "aggregated comment"
+                labels, scores, n_unique = self.analyze_text_column(
+                    df["all_comments_text"], "aggregated comment"
                 )
 
-                df["comments_sentiment_label"] = [s["label"] for s in comment_results]
-                df["comments_sentiment_score"] = [s["score"] for s in comment_results]
-                print(f"  ✅ Analyzed {len(comment_results)} aggregated comment texts")
+                df["comments_sentiment_label"] = labels
+                df["comments_sentiment_score"] = scores
+                print(
+                    f"  ✅ Analyzed {len(df)} aggregated comment texts ({n_unique} unique)"
+                )
             else:
                 print("  ℹ️  No all_comments_text column found")
                 df["comments_sentiment_label"] = "NEUTRAL"
@@ -137,11 +131,8 @@ class InstagramSentimentAnalyzer:
 
         # Caption sentiments (all modes)
         if "caption_sentiment_label" in df.columns:
-            caption_counts = df["caption_sentiment_label"].value_counts().to_dict()
             print(f"  📝 Post Caption Sentiments:")
-            for sentiment, count in sorted(caption_counts.items()):
-                percentage = (count / len(df)) * 100
-                print(f"     • {sentiment}: {count} ({percentage:.1f}%)")
+            print(format_counts(df["caption_sentiment_label"]))
 
         # Comment sentiments (varies by mode)
         if scraping_mode in ["profile", "post_url"]:
@@ -151,17 +142,10 @@ class InstagramSentimentAnalyzer:
                     df["comment_text"].notna() & (df["comment_text"] != "")
                 ]
                 if len(with_comments) > 0:
-                    comment_counts = (
-                        with_comments["comment_sentiment_label"]
-                        .value_counts()
-                        .to_dict()
-                    )
                     print(
                         f"\n  💬 Individual Comment Sentiments ({len(with_comments)} comments):"
                     )
-                    for sentiment, count in sorted(comment_counts.items()):
-                        percentage = (count / len(with_comments)) * 100
-                        print(f"     • {sentiment}: {count} ({percentage:.1f}%)")
+                    print(format_counts(with_comments["comment_sentiment_label"]))
                 else:
                     print(f"\n  💬 No comments found to analyze")
 
@@ -172,30 +156,58 @@ class InstagramSentimentAnalyzer:
                     df["all_comments_text"].notna() & (df["all_comments_text"] != "")
                 ]
                 if len(with_comments) > 0:
-                    comment_counts = (
-                        with_comments["comments_sentiment_label"]
-                        .value_counts()
-                        .to_dict()
-                    )
                     print(
                         f"\n  💬 Aggregated Comments Sentiments ({len(with_comments)} posts with comments):"
                     )
-                    for sentiment, count in sorted(comment_counts.items()):
-                        percentage = (count / len(with_comments)) * 100
-                        print(f"     • {sentiment}: {count} ({percentage:.1f}%)")
+                    print(format_counts(with_comments["comments_sentiment_label"]))
                 else:
                     print(f"\n  💬 No comments found to analyze")
 
 
-def analyze_instagram_sentiment(csv_file):
+def analyze_instagram_sentiment(csv_file, chunksize=None, output_format="csv"):
     """
     Standalone function to analyze sentiment of existing Instagram data.
     Can be called separately or integrated into scraping pipeline.
     Supports all scraping modes: profile, keyword, post_url
+    chunksize: stream the file through the analyzer this many rows at a time,
+        appending each chunk to the output CSV, so memory use is bounded by
+        the chunk rather than the file; returns the output path instead of
+        the analyzed dataframe (chunked output is always CSV, so combining it
+        with output_format="parquet" raises ValueError)
+    output_format: "csv" (default) or "parquet" (Snappy-compressed, needs
+        pyarrow), which is much faster to write and smaller for large files
     """
+    if chunksize and output_format == "parquet":
+        raise ValueError("Parquet output is not supported with chunksize")
+
     print(f"\n📂 Loading data from: {csv_file}")
+    output_file = csv_file.replace(".csv", "_with_sentiment.csv")
     try:
-        df = pd.read_csv(csv_file)
+        if chunksize:
+            analyzer = InstagramSentimentAnalyzer()
+            total_rows = 0
+            for i, chunk in enumerate(pd.read_csv(csv_file, chunksize=chunksize)):
+                print(
+                    f"\n📦 Chunk {i + 1}: rows {total_rows + 1}-{total_rows + len(chunk)}"
+                )
+                chunk = analyzer.analyze_instagram_data(chunk)
+                chunk.to_csv(
+                    output_file,
+                    mode="w" if i == 0 else "a",
+                    header=i == 0,
+                    index=False,
+                    encoding="utf-8-sig",
+                )
+                total_rows += len(chunk)
+            print(f"\n💾 Saved {total_rows} rows with sentiment to: {output_file}")
+            return output_file
+
+        # Load the model in the background while the CSV is read
+        analyzer = InstagramSentimentAnalyzer()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            load_future = executor.submit(analyzer._load)
+            df = pd.read_csv(csv_file)
+            load_future.result()
         print(f"✅ Loaded {len(df)} rows with {len(df.columns)} columns")
 
         # Show detected columns
@@ -211,11 +223,20 @@ def analyze_instagram_sentiment(csv_file):
         for col in key_columns:
             print(f"   • {col}")
 
-        analyzer = InstagramSentimentAnalyzer()
         df = analyzer.analyze_instagram_data(df)
 
         # Save with sentiment
-        output_file = csv_file.replace(".csv", "_with_sentiment.csv")
+        if output_format == "parquet":
+            parquet_file = output_file.replace(".csv", ".parquet")
+            try:
+                df.to_parquet(
+                    parquet_file, engine="pyarrow", compression="snappy", index=False
+                )
+                print(f"\n💾 Saved with sentiment to: {parquet_file}")
+                return df
+            except Exception as e:
+                print(f"⚠️  Parquet export failed ({e}), falling back to CSV")
+
         df.to_csv(output_file, index=False, encoding="utf-8-sig")
         print(f"\n💾 Saved with sentiment to: {output_file}")
 
@@ -231,17 +252,34 @@ def analyze_instagram_sentiment(csv_file):
 if __name__ == "__main__":
     import sys
 
-    if len(sys.argv) > 1:
-        analyze_instagram_sentiment(sys.argv[1])
+    args = [arg for arg in sys.argv[1:] if arg != "--parquet"]
+    output_format = "parquet" if "--parquet" in sys.argv else "csv"
+    chunksize = None
+    if len(args) > 1:
+        if args[1].isdigit() and int(args[1]) > 0:
+            chunksize = int(args[1])
+        else:
+            print(f"❌ chunk_size must be a positive integer, got: {args[1]}")
+            args = []
+        if chunksize and output_format == "parquet":
+            print("❌ --parquet can't be combined with a chunk size")
+            args = []
+
+    if args:
+        analyze_instagram_sentiment(args[0], chunksize, output_format)
     else:
         print("\n" + "=" * 60)
         print("Instagram Sentiment Analysis")
         print("=" * 60)
-        print("\nUsage: python sentiment_insta.py <csv_file_path>")
+        print(
+            "\nUsage: python sentiment_insta.py <csv_file_path> [chunk_size] [--parquet]"
+        )
         print("\nExample:")
         print(
             "  python sentiment_insta.py Data/Instagram/final/profile_username_20241209.csv"
         )
+        print("\nPass a chunk size (e.g. 4096) to stream large files in pieces,")
+        print("or --parquet (without a chunk size) to save the result as Parquet.")
         print("\nSupports data from all scraping modes:")
         print("  • Profile scraping")
         print("  • Keyword/hashtag scraping")
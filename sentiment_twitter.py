@@ -1,37 +1,17 @@
-from transformers import pipeline
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
 
+from sentiment_common import (
+    BaseSentimentAnalyzer,
+    format_counts,
+    results_to_columns,
+)
 
-class TwitterSentimentAnalyzer:
-    def __init__(self, model_name="cardiffnlp/twitter-roberta-base-sentiment-latest"):
-        """
-        Initialize sentiment analyzer with 3-class sentiment model.
-        Model outputs: POSITIVE, NEUTRAL, NEGATIVE
-        """
-        print("Initializing Twitter sentiment analyzer...")
-        print("Loading model: cardiffnlp/twitter-roberta-base-sentiment-latest")
-        self.analyzer = pipeline("sentiment-analysis", model=model_name)
-        print("✅ Sentiment analyzer ready!")
 
-    def analyze_text_batch(self, texts, text_type="text"):
-        """
-        Analyze a batch of texts and return sentiment results.
-        Handles empty texts and errors gracefully.
-        """
-        results = []
-        for i, text in enumerate(texts):
-            if pd.isna(text) or str(text).strip() == "" or str(text) == "nan":
-                results.append({"label": "NEUTRAL", "score": 0.0})
-            else:
-                try:
-                    # Truncate to 512 tokens for model
-                    result = self.analyzer(str(text)[:512], truncation=True)[0]
-                    results.append(result)
-                except Exception as e:
-                    if i < 5:  # Only print first 5 errors
-                        print(f"    ⚠️ Error analyzing {text_type} {i}: {e}")
-                    results.append({"label": "NEUTRAL", "score": 0.0})
-        return results
+class TwitterSentimentAnalyzer(BaseSentimentAnalyzer):
+    platform = "Twitter"
 
     def analyze_twitter_data(self, df):
         """
@@ -47,15 +27,39 @@ class TwitterSentimentAnalyzer:
         print(f"{'='*60}")
         print(f"Analyzing sentiment for {len(df)} rows...")
 
+        # Reply rows, shared by the interaction analysis and the summary
+        if "interaction_type" in df.columns:
+            reply_mask = df["interaction_type"].to_numpy() == "reply"
+        else:
+            reply_mask = np.zeros(len(df), dtype=bool)
+
         # Analyze main tweet text
         if "tweet_text" in df.columns:
             print(f"\n  → Analyzing main tweet texts...")
-            tweet_texts = df["tweet_text"].fillna("").astype(str).tolist()
-            tweet_results = self.analyze_text_batch(tweet_texts, "tweet")
+            if "tweet_id" in df.columns:
+                # Tweet text repeats on every interaction row of a tweet, so
+                # analyze each tweet once and map results back by tweet_id
+                tweets = df.drop_duplicates(subset=["tweet_id"])
+                tweet_texts = tweets["tweet_text"].fillna("").astype(str).tolist()
+                tweet_results = self.analyze_text_batch(tweet_texts, "tweet")
 
-            df["tweet_sentiment_label"] = [s["label"] for s in tweet_results]
-            df["tweet_sentiment_score"] = [s["score"] for s in tweet_results]
-            print(f"  ✅ Analyzed {len(tweet_results)} tweets")
+                labels, scores = results_to_columns(tweet_results)
+                label_map = dict(zip(tweets["tweet_id"], labels))
+                score_map = dict(zip(tweets["tweet_id"], scores))
+                df["tweet_sentiment_label"] = (
+                    df["tweet_id"].map(label_map).astype(labels.dtype)
+                )
+                df["tweet_sentiment_score"] = (
+                    df["tweet_id"].map(score_map).astype(np.float32)
+                )
+            else:
+                tweet_texts = df["tweet_text"].fillna("").astype(str).tolist()
+                tweet_results = self.analyze_text_batch(tweet_texts, "tweet")
+
+                labels, scores = results_to_columns(tweet_results)
+                df["tweet_sentiment_label"] = labels
+                df["tweet_sentiment_score"] = scores
+            print(f"  ✅ Analyzed {len(df)} rows ({len(tweet_results)} unique tweets)")
         else:
             print("  ℹ️  No tweet_text column found")
             df["tweet_sentiment_label"] = "NEUTRAL"
@@ -66,23 +70,20 @@ class TwitterSentimentAnalyzer:
             print(f"\n  → Analyzing interaction texts (replies)...")
 
             # Only analyze replies (retweeters have empty text)
-            reply_mask = df["interaction_type"] == "reply"
             reply_texts = df.loc[reply_mask, "text"].fillna("").astype(str).tolist()
 
             if len(reply_texts) > 0:
                 reply_results = self.analyze_text_batch(reply_texts, "reply")
 
-                # Initialize columns with NEUTRAL
-                df["interaction_sentiment_label"] = "NEUTRAL"
-                df["interaction_sentiment_score"] = 0.0
-
-                # Fill in reply sentiments
-                df.loc[reply_mask, "interaction_sentiment_label"] = [
-                    s["label"] for s in reply_results
-                ]
-                df.loc[reply_mask, "interaction_sentiment_score"] = [
-                    s["score"] for s in reply_results
-                ]
+                # Start every row at NEUTRAL and fill in reply sentiments
+                # positionally, so each column is assigned once
+                reply_labels, reply_scores = results_to_columns(reply_results)
+                labels = np.full(len(df), "NEUTRAL", dtype=object)
+                scores = np.zeros(len(df), dtype=np.float32)
+                labels[reply_mask] = np.asarray(reply_labels, dtype=object)
+                scores[reply_mask] = reply_scores
+                df["interaction_sentiment_label"] = pd.Categorical(labels)
+                df["interaction_sentiment_score"] = scores
 
                 print(f"  ✅ Analyzed {len(reply_results)} replies")
             else:
@@ -95,14 +96,16 @@ class TwitterSentimentAnalyzer:
             df["interaction_sentiment_score"] = 0.0
 
         # Print summary statistics
-        self._print_sentiment_summary(df)
+        self._print_sentiment_summary(df, reply_mask)
 
         print(f"{'='*60}\n")
         return df
 
-    def _print_sentiment_summary(self, df):
+    def _print_sentiment_summary(self, df, reply_mask=None):
         """
         Print sentiment analysis summary.
+        reply_mask: boolean array marking reply rows, computed from
+            interaction_type when not given
         """
         print(f"\n📊 Sentiment Analysis Summary:")
 
@@ -114,46 +117,70 @@ class TwitterSentimentAnalyzer:
                 if "tweet_id" in df.columns
                 else df
             )
-            tweet_counts = (
-                unique_tweets["tweet_sentiment_label"].value_counts().to_dict()
-            )
             print(f"  📝 Main Tweet Sentiments ({len(unique_tweets)} unique tweets):")
-            for sentiment, count in sorted(tweet_counts.items()):
-                percentage = (count / len(unique_tweets)) * 100
-                print(f"     • {sentiment}: {count} ({percentage:.1f}%)")
+            print(format_counts(unique_tweets["tweet_sentiment_label"]))
 
         # Reply sentiments (exclude retweeters)
         if (
             "interaction_sentiment_label" in df.columns
             and "interaction_type" in df.columns
         ):
-            replies = df[df["interaction_type"] == "reply"]
+            if reply_mask is None:
+                reply_mask = df["interaction_type"].to_numpy() == "reply"
+            replies = df[reply_mask]
             if len(replies) > 0:
-                reply_counts = (
-                    replies["interaction_sentiment_label"].value_counts().to_dict()
-                )
                 print(f"\n  💬 Reply Sentiments ({len(replies)} replies):")
-                for sentiment, count in sorted(reply_counts.items()):
-                    percentage = (count / len(replies)) * 100
-                    print(f"     • {sentiment}: {count} ({percentage:.1f}%)")
+                print(format_counts(replies["interaction_sentiment_label"]))
 
         # Interaction type breakdown
         if "interaction_type" in df.columns:
-            interaction_counts = df["interaction_type"].value_counts().to_dict()
             print(f"\n  🔄 Interaction Breakdown:")
-            for itype, count in interaction_counts.items():
-                percentage = (count / len(df)) * 100
-                print(f"     • {itype}: {count} ({percentage:.1f}%)")
+            print(format_counts(df["interaction_type"], sort_labels=False))
 
 
-def analyze_twitter_sentiment(csv_file):
+def analyze_twitter_sentiment(csv_file, chunksize=None, output_format="csv"):
     """
     Standalone function to analyze sentiment of existing Twitter data.
     Can be called separately or integrated into scraping pipeline.
+    chunksize: stream the file through the analyzer this many rows at a time,
+        appending each chunk to the output CSV, so memory use is bounded by
+        the chunk rather than the file; returns the output path instead of
+        the analyzed dataframe (chunked output is always CSV, so combining it
+        with output_format="parquet" raises ValueError)
+    output_format: "csv" (default) or "parquet" (Snappy-compressed, needs
+        pyarrow), which is much faster to write and smaller for large files
     """
+    if chunksize and output_format == "parquet":
+        raise ValueError("Parquet output is not supported with chunksize")
+
     print(f"\n📂 Loading data from: {csv_file}")
+    output_file = csv_file.replace(".csv", "_with_sentiment.csv")
     try:
-        df = pd.read_csv(csv_file)
+        if chunksize:
+            analyzer = TwitterSentimentAnalyzer()
+            total_rows = 0
+            for i, chunk in enumerate(pd.read_csv(csv_file, chunksize=chunksize)):
+                print(
+                    f"\n📦 Chunk {i + 1}: rows {total_rows + 1}-{total_rows + len(chunk)}"
+                )
+                chunk = analyzer.analyze_twitter_data(chunk)
+                chunk.to_csv(
+                    output_file,
+                    mode="w" if i == 0 else "a",
+                    header=i == 0,
+                    index=False,
+                    encoding="utf-8-sig",
+                )
+                total_rows += len(chunk)
+            print(f"\n💾 Saved {total_rows} rows with sentiment to: {output_file}")
+            return output_file
+
+        # Load the model in the background while the CSV is read
+        analyzer = TwitterSentimentAnalyzer()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            load_future = executor.submit(analyzer._load)
+            df = pd.read_csv(csv_file)
+            load_future.result()
         print(f"✅ Loaded {len(df)} rows with {len(df.columns)} columns")
 
         # Show detected columns
@@ -169,11 +196,20 @@ def analyze_twitter_sentiment(csv_file):
         for col in key_columns:
             print(f"   • {col}")
 
-        analyzer = TwitterSentimentAnalyzer()
         df = analyzer.analyze_twitter_data(df)
 
         # Save with sentiment
-        output_file = csv_file.replace(".csv", "_with_sentiment.csv")
+        if output_format == "parquet":
+            parquet_file = output_file.replace(".csv", ".parquet")
+            try:
+                df.to_parquet(
+                    parquet_file, engine="pyarrow", compression="snappy", index=False
+                )
+                print(f"\n💾 Saved with sentiment to: {parquet_file}")
+                return df
+            except Exception as e:
+                print(f"⚠️  Parquet export failed ({e}), falling back to CSV")
+
         df.to_csv(output_file, index=False, encoding="utf-8-sig")
         print(f"\n💾 Saved with sentiment to: {output_file}")
 
@@ -189,17 +225,34 @@ def analyze_twitter_sentiment(csv_file):
 if __name__ == "__main__":
     import sys
 
-    if len(sys.argv) > 1:
-        analyze_twitter_sentiment(sys.argv[1])
+    args = [arg for arg in sys.argv[1:] if arg != "--parquet"]
+    output_format = "parquet" if "--parquet" in sys.argv else "csv"
+    chunksize = None
+    if len(args) > 1:
+        if args[1].isdigit() and int(args[1]) > 0:
+            chunksize = int(args[1])
+        else:
+            print(f"❌ chunk_size must be a positive integer, got: {args[1]}")
+            args = []
+        if chunksize and output_format == "parquet":
+            print("❌ --parquet can't be combined with a chunk size")
+            args = []
+
+    if args:
+        analyze_twitter_sentiment(args[0], chunksize, output_format)
     else:
         print("\n" + "=" * 60)
         print("Twitter Sentiment Analysis")
         print("=" * 60)
-        print("\nUsage: python sentiment_twitter.py <csv_file_path>")
+        print(
+            "\nUsage: python sentiment_twitter.py <csv_file_path> [chunk_size] [--parquet]"
+        )
         print("\nExample:")
         print(
             "  python sentiment_twitter.py Data/Twitter/final/username_all_tweets_20241209.csv"
         )
+        print("\nPass a chunk size (e.g. 4096) to stream large files in pieces,")
+        print("or --parquet (without a chunk size) to save the result as Parquet.")
         print("\nAnalyzes sentiment for:")
         print("  • Main tweet texts")
         print("  • Reply texts")